@@ -8,19 +8,30 @@ import subprocess
 import tempfile
 from dataclasses import dataclass, field
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    from json import loads as json_loads  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 KUBECTL = shutil.which("kubectl") or "kubectl"
 ARGOCD = shutil.which("argocd") or "argocd"
 ARGOCD_TIMEOUT = int(os.getenv("KUBE_LINT_ARGOCD_TIMEOUT", "60"))
+# Longest diff (in characters) returned by diff_argocd_app; 0 disables the cap
+ARGOCD_DIFF_LIMIT = int(os.getenv("KUBE_LINT_ARGOCD_DIFF_LIMIT", "1048576"))
 
 NAMESPACE_NOT_FOUND_ERROR = (
     "Could not auto-detect ArgoCD namespace (argocd-cm configmap not found in any namespace). "
     "Specify the namespace parameter explicitly."
 )
 
+# Detected ArgoCD namespace per kubectl context. Only successful detections are
+# cached so a transient kubectl failure is retried on the next call.
+_namespace_cache: dict[str, str] = {}
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ArgoAppSummary:
     """Summary of a single ArgoCD Application."""
 
@@ -34,7 +45,7 @@ class ArgoAppSummary:
     target_revision: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ArgoAppListResult:
     """Result of listing ArgoCD applications."""
 
@@ -43,7 +54,7 @@ class ArgoAppListResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ArgoAppGetResult:
     """Result of getting detailed ArgoCD application status."""
 
@@ -63,7 +74,7 @@ class ArgoAppGetResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ArgoAppDiffResult:
     """Result of ArgoCD app diff (live vs desired state)."""
 
@@ -76,7 +87,8 @@ class ArgoAppDiffResult:
 def _detect_argocd_namespace(context: str) -> str | None:
     """Auto-detect the namespace where ArgoCD is installed.
 
-    Looks for the argocd-cm configmap across all namespaces.
+    Looks for the argocd-cm configmap across all namespaces. The result is
+    cached per context for the lifetime of the process.
 
     Args:
         context: kubectl context to use
@@ -84,20 +96,27 @@ def _detect_argocd_namespace(context: str) -> str | None:
     Returns:
         Namespace name if found, None otherwise
     """
+    cached = _namespace_cache.get(context)
+    if cached is not None:
+        logger.debug("Using cached ArgoCD namespace for %s: %s", context, cached)
+        return cached
+
     cmd = [
         KUBECTL, "get", "configmap", "argocd-cm",
         "--all-namespaces",
         "--context", context,
         "-o", "jsonpath={.items[0].metadata.namespace}",
     ]
-    logger.debug("Auto-detecting ArgoCD namespace: %s", " ".join(cmd))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Auto-detecting ArgoCD namespace: %s", " ".join(cmd))
     try:
         result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=30,
+            cmd, capture_output=True, close_fds=False, text=True, timeout=30,
         )
         if result.returncode == 0 and result.stdout.strip():
             ns = result.stdout.strip()
             logger.debug("Auto-detected ArgoCD namespace: %s", ns)
+            _namespace_cache[context] = ns
             return ns
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
@@ -105,6 +124,11 @@ def _detect_argocd_namespace(context: str) -> str | None:
     return None
 
 
+def reset_argocd_namespace_cache() -> None:
+    """Forget all auto-detected ArgoCD namespaces."""
+    _namespace_cache.clear()
+
+
 def _build_argocd_args(context: str) -> list[str]:
     """Build common ArgoCD CLI args for diff command.
 
@@ -142,25 +166,28 @@ def _build_temp_kubeconfig(context: str, namespace: str) -> str:
             "--kubeconfig", temp_path,
         ],
         capture_output=True,
+        close_fds=False,
         text=True,
         timeout=10,
     )
     return temp_path
 
 
+def _decode(output: bytes) -> str:
+    """Decode raw kubectl output for use in an error message."""
+    return output.decode("utf-8", errors="replace")
+
+
 def _extract_source(spec: dict[str, object]) -> tuple[str, str, str]:
     """Extract repo_url, path, target_revision from spec.source or spec.sources[0]."""
-    source = spec.get("source", {})
-    if not source and "sources" in spec:
-        sources = spec.get("sources", [])
-        if isinstance(sources, list) and sources:
-            source = sources[0]
+    source = spec.get("source")
+    if not source:
+        sources = spec.get("sources")
+        source = sources[0] if isinstance(sources, list) and sources else None
     if not isinstance(source, dict):
-        source = {}
-    repo_url = str(source.get("repoURL", ""))
-    path = str(source.get("path", ""))
-    target_revision = str(source.get("targetRevision", ""))
-    return repo_url, path, target_revision
+        return "", "", ""
+    get = source.get
+    return str(get("repoURL", "")), str(get("path", "")), str(get("targetRevision", ""))
 
 
 def _extract_resources(status: dict[str, object]) -> list[dict[str, str]] | None:
@@ -225,12 +252,13 @@ def list_argocd_apps(
         "-o", "json",
     ]
 
-    logger.debug("Running: %s", " ".join(cmd))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running: %s", " ".join(cmd))
     try:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
+            close_fds=False,
             timeout=ARGOCD_TIMEOUT,
         )
     except subprocess.TimeoutExpired:
@@ -241,12 +269,12 @@ def list_argocd_apps(
         return ArgoAppListResult(success=False, error="kubectl not found")
 
     if result.returncode != 0:
-        error = result.stderr.strip() or result.stdout.strip()
+        error = _decode(result.stderr).strip() or _decode(result.stdout).strip()
         logger.warning("kubectl get applications failed: %s", error)
         return ArgoAppListResult(success=False, error=error)
 
     try:
-        data = json.loads(result.stdout)
+        data = json_loads(result.stdout)
     except json.JSONDecodeError as exc:
         logger.exception("Failed to parse kubectl output")
         return ArgoAppListResult(
@@ -317,12 +345,13 @@ def get_argocd_app(
         "-o", "json",
     ]
 
-    logger.debug("Running: %s", " ".join(cmd))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running: %s", " ".join(cmd))
     try:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
+            close_fds=False,
             timeout=ARGOCD_TIMEOUT,
         )
     except subprocess.TimeoutExpired:
@@ -333,12 +362,12 @@ def get_argocd_app(
         return ArgoAppGetResult(success=False, error="kubectl not found")
 
     if result.returncode != 0:
-        error = result.stderr.strip() or result.stdout.strip()
+        error = _decode(result.stderr).strip() or _decode(result.stdout).strip()
         logger.warning("kubectl get application failed: %s", error)
         return ArgoAppGetResult(success=False, error=error)
 
     try:
-        data = json.loads(result.stdout)
+        data = json_loads(result.stdout)
     except json.JSONDecodeError as exc:
         logger.exception("Failed to parse kubectl output")
         return ArgoAppGetResult(
@@ -394,6 +423,8 @@ def diff_argocd_app(
         1 = has diff (diff output on stdout)
         2 = error
 
+    Diff output longer than ARGOCD_DIFF_LIMIT characters is truncated.
+
     Args:
         app_name: Name of the ArgoCD Application
         context: kubectl context to use
@@ -417,11 +448,13 @@ def diff_argocd_app(
         cmd = [ARGOCD, "app", "diff", app_name, *base_args]
         env = {**os.environ, "KUBECONFIG": temp_kubeconfig}
 
-        logger.debug("Running: %s (KUBECONFIG=%s)", " ".join(cmd), temp_kubeconfig)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running: %s (KUBECONFIG=%s)", " ".join(cmd), temp_kubeconfig)
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
+                close_fds=False,
                 text=True,
                 timeout=ARGOCD_TIMEOUT,
                 env=env,
@@ -437,6 +470,9 @@ def diff_argocd_app(
             return ArgoAppDiffResult(success=True, in_sync=True)
         elif result.returncode == 1:
             diff_output = result.stdout.strip() or result.stderr.strip()
+            if ARGOCD_DIFF_LIMIT and len(diff_output) > ARGOCD_DIFF_LIMIT:
+                dropped = len(diff_output) - ARGOCD_DIFF_LIMIT
+                diff_output = f"{diff_output[:ARGOCD_DIFF_LIMIT]}\n[truncated {dropped} characters]"
             return ArgoAppDiffResult(
                 success=True,
                 in_sync=False,
@@ -2,17 +2,30 @@
 
 import logging
 import os
+import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 KUBECTL = shutil.which("kubectl") or "kubectl"
 KUBECTL_TIMEOUT = int(os.getenv("KUBE_LINT_KUBECTL_TIMEOUT", "60"))
+KUBECTL_NOT_FOUND = "kubectl not found"
 
+# A line that starts with "warning:" or mentions "deprecated" anywhere (case-insensitive)
+_WARNING_LINE_RE = re.compile(rb"^[^\S\n]*((?:warning:|.*deprecated).*)$", re.IGNORECASE | re.MULTILINE)
 
-@dataclass
+# helm template and kubectl kustomize separate documents with bare "---" lines
+# and may emit comment-only documents (helm's "# Source:" headers), so a
+# document counts only if it has a line that is neither blank nor a comment.
+# Hand-written files may also use CRLF endings or "--- # comment" separators.
+_DOC_SEPARATOR_RE = re.compile(rb"^---(?:[ \t]+#[^\r\n]*|[ \t]*)\r?$", re.MULTILINE)
+_CONTENT_LINE_RE = re.compile(rb"^[ \t]*[^\s#]", re.MULTILINE)
+
+
+@dataclass(slots=True, frozen=True)
 class DryRunResult:
     """Result of a client + server kubectl dry-run pair."""
 
@@ -21,6 +34,7 @@ class DryRunResult:
     client_error: str | None = None
     server_error: str | None = None
     warnings: list[str] | None = None
+    server_skipped: bool = False
 
 
 def build_ctx_args(context: str | None) -> list[str]:
@@ -28,24 +42,65 @@ def build_ctx_args(context: str | None) -> list[str]:
     return ["--context", context] if context else []
 
 
-def parse_warnings(output: str) -> list[str]:
-    """Extract warning and deprecation lines from kubectl output."""
-    warnings = []
-    for line in output.split("\n"):
-        stripped = line.strip()
-        if not stripped:
-            continue
-        line_lower = stripped.lower()
-        if "deprecated" in line_lower or line_lower.startswith("warning:"):
-            warnings.append(stripped)
-    return warnings
+def parse_warnings(output: bytes) -> list[str]:
+    """Extract warning and deprecation lines from raw kubectl output."""
+    return [_decode(m.group(1).strip()) for m in _WARNING_LINE_RE.finditer(output)]
+
+
+def count_documents(rendered: bytes) -> int:
+    """Count non-empty YAML documents in rendered manifests without parsing them."""
+    return sum(1 for doc in _DOC_SEPARATOR_RE.split(rendered) if _CONTENT_LINE_RE.search(doc))
+
+
+def _decode(output: bytes) -> str:
+    return output.decode("utf-8", errors="replace")
+
+
+def _apply_dry_run(
+    mode: str,
+    ctx_args: list[str],
+    source_args: list[str],
+    timeout: int,
+    stdin_data: bytes | None,
+) -> subprocess.CompletedProcess[bytes]:
+    """Run a single `kubectl apply --dry-run=<mode>` invocation."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Running %s dry-run: kubectl %s apply --dry-run=%s %s",
+            mode,
+            " ".join(ctx_args),
+            mode,
+            " ".join(source_args),
+        )
+    return subprocess.run(
+        [KUBECTL, *ctx_args, "apply", f"--dry-run={mode}", *source_args],
+        capture_output=True,
+        # Python opens descriptors non-inheritable, so there is nothing to close;
+        # skipping the sweep also lets CPython use posix_spawn
+        close_fds=False,
+        timeout=timeout,
+        input=stdin_data,
+    )
+
+
+def _client_failure(client_result: subprocess.CompletedProcess[bytes]) -> DryRunResult:
+    client_error = _decode(client_result.stderr).strip()
+    logger.debug("Client dry-run failed: %s", client_error)
+    return DryRunResult(
+        client_passed=False,
+        server_passed=False,
+        client_error=client_error,
+    )
 
 
 def kubectl_dry_run(
     file_path: str | None = None,
     context: str | None = None,
     timeout: int = KUBECTL_TIMEOUT,
-    stdin_data: str | None = None,
+    stdin_data: str | bytes | None = None,
+    fast: bool = False,
+    server: bool = True,
+    parallel: bool = False,
 ) -> DryRunResult:
     """Run client + server kubectl dry-run on a manifest file or stdin data.
 
@@ -53,7 +108,16 @@ def kubectl_dry_run(
         file_path: Path to the YAML manifest file (used when stdin_data is None)
         context: Optional kubectl context (passed via --context flag)
         timeout: Timeout in seconds for each subprocess call
-        stdin_data: Optional YAML string to pipe via stdin instead of reading a file
+        stdin_data: Optional YAML (str or bytes) to pipe via stdin instead of reading a file
+        fast: Run the server dry-run first and only fall back to a client dry-run
+            when it fails, to tell client-side errors from server rejections.
+            Saves one kubectl invocation when the manifest is valid.
+        server: Run the server dry-run. When False only the client dry-run runs
+            and the result is marked server_skipped.
+        parallel: Start the client and server dry-runs at the same time instead
+            of one after the other. If the client one fails its result is returned
+            straight away; the server dry-run, already sent, is left to finish in
+            the background and its result is discarded.
 
     Returns:
         DryRunResult with client/server pass/fail and any deprecation warnings
@@ -61,50 +125,43 @@ def kubectl_dry_run(
     ctx_args = build_ctx_args(context)
     file_arg = "-" if stdin_data is not None else (file_path or "")
     source_args = ["-f", file_arg]
+    stdin_bytes = stdin_data.encode() if isinstance(stdin_data, str) else stdin_data
 
     try:
-        # Client dry-run
-        logger.debug(
-            "Running client dry-run: kubectl %s apply --dry-run=client %s",
-            " ".join(ctx_args),
-            " ".join(source_args),
-        )
-        client_result = subprocess.run(
-            [KUBECTL, *ctx_args, "apply", "--dry-run=client", *source_args],
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            input=stdin_data,
-        )
-        client_passed = client_result.returncode == 0
-        client_error = client_result.stderr.strip() if not client_passed else None
-
-        if not client_passed:
-            logger.debug("Client dry-run failed: %s", client_error)
-            return DryRunResult(
-                client_passed=False,
-                server_passed=False,
-                client_error=client_error,
-            )
-
-        # Server dry-run
-        logger.debug(
-            "Running server dry-run: kubectl %s apply --dry-run=server %s",
-            " ".join(ctx_args),
-            " ".join(source_args),
-        )
-        server_result = subprocess.run(
-            [KUBECTL, *ctx_args, "apply", "--dry-run=server", *source_args],
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            input=stdin_data,
-        )
+        if parallel and server and not fast:
+            executor = ThreadPoolExecutor(max_workers=2)
+            try:
+                client_future = executor.submit(_apply_dry_run, "client", ctx_args, source_args, timeout, stdin_bytes)
+                server_future = executor.submit(_apply_dry_run, "server", ctx_args, source_args, timeout, stdin_bytes)
+                client_result = client_future.result()
+                if client_result.returncode != 0:
+                    # Don't hold a fast client rejection behind a slow or unreachable API server
+                    return _client_failure(client_result)
+                server_result = server_future.result()
+            finally:
+                executor.shutdown(wait=False)
+        else:
+            if not fast or not server:
+                client_result = _apply_dry_run("client", ctx_args, source_args, timeout, stdin_bytes)
+                if client_result.returncode != 0:
+                    return _client_failure(client_result)
+
+            if not server:
+                logger.debug("Skipping server dry-run")
+                return DryRunResult(client_passed=True, server_passed=True, server_skipped=True)
+
+            server_result = _apply_dry_run("server", ctx_args, source_args, timeout, stdin_bytes)
+
         server_passed = server_result.returncode == 0
-        server_error = server_result.stderr.strip() if not server_passed else None
 
-        output = server_result.stdout + server_result.stderr
-        warnings = parse_warnings(output)
+        if fast and not server_passed:
+            client_result = _apply_dry_run("client", ctx_args, source_args, timeout, stdin_bytes)
+            if client_result.returncode != 0:
+                return _client_failure(client_result)
+
+        server_error = _decode(server_result.stderr).strip() if not server_passed else None
+
+        warnings = parse_warnings(server_result.stdout) + parse_warnings(server_result.stderr)
 
         if warnings:
             logger.warning("Warnings detected: %s", warnings)
@@ -128,5 +185,5 @@ def kubectl_dry_run(
         return DryRunResult(
             client_passed=False,
             server_passed=False,
-            client_error="kubectl not found",
+            client_error=KUBECTL_NOT_FOUND,
         )
@@ -1,22 +1,50 @@
 """FluxCD and Kubernetes manifest validation utilities."""
 
+import hashlib
 import logging
 import os
 import shutil
 import subprocess
-from dataclasses import dataclass
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from pathlib import Path
 
-from kube_lint_mcp.dryrun import build_ctx_args, kubectl_dry_run
+import yaml
+
+from kube_lint_mcp.dryrun import KUBECTL_NOT_FOUND, build_ctx_args, count_documents, kubectl_dry_run
 
 logger = logging.getLogger(__name__)
 
 KUBECTL = shutil.which("kubectl") or "kubectl"
 FLUX = shutil.which("flux") or "flux"
 FLUX_TIMEOUT = int(os.getenv("KUBE_LINT_FLUX_TIMEOUT", "60"))
-
-
-@dataclass
+PARALLELISM = max(1, int(os.getenv("KUBE_LINT_PARALLELISM", "8")))
+BATCH_DRYRUN = os.getenv("KUBE_LINT_BATCH", "1") != "0"
+CONTEXTS_CACHE_TTL = 5.0
+YAML_SUFFIXES = (".yaml", ".yml")
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Built-in (apiVersion, kind) pairs whose client dry-run catches practically
+# everything a server dry-run would, barring admission webhooks and quotas.
+CLIENT_ONLY_KINDS = frozenset({
+    ("v1", "ConfigMap"),
+    ("v1", "Secret"),
+    ("v1", "Service"),
+    ("v1", "ServiceAccount"),
+    ("apps/v1", "Deployment"),
+    ("apps/v1", "StatefulSet"),
+    ("apps/v1", "DaemonSet"),
+    ("batch/v1", "Job"),
+    ("batch/v1", "CronJob"),
+})
+
+# (monotonic timestamp, kubeconfig stamp, (contexts, current)) from the last successful lookup
+_contexts_cache: tuple[float, tuple[int | None, ...], tuple[list[str], str | None]] | None = None
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of a dry-run validation."""
 
@@ -26,33 +54,61 @@ class ValidationResult:
     client_error: str | None = None
     server_error: str | None = None
     warnings: list[str] | None = None
+    server_skipped: bool = False
+
+
+def _run_kubectl_config(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [KUBECTL, "config", *args],
+        capture_output=True,
+        close_fds=False,
+        text=True,
+        timeout=10,
+    )
+
+
+def _kubeconfig_stamp() -> tuple[int | None, ...]:
+    """Modification times of the kubeconfig files kubectl would read."""
+    paths = os.environ.get("KUBECONFIG") or os.path.expanduser("~/.kube/config")
+    stamp: list[int | None] = []
+    for kubeconfig in paths.split(os.pathsep):
+        try:
+            stamp.append(os.stat(kubeconfig).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
 
 
 def get_kubectl_contexts() -> tuple[list[str], str | None]:
     """Get list of available kubectl contexts and current context.
 
+    Results are reused for CONTEXTS_CACHE_TTL seconds so back-to-back tool
+    calls do not fork kubectl twice each. Editing the kubeconfig invalidates
+    the cache immediately.
+
     Returns:
         Tuple of (list of context names, current context name or None)
     """
+    global _contexts_cache
+
+    stamp = _kubeconfig_stamp()
+    if _contexts_cache is not None:
+        cached_at, cached_stamp, (cached_contexts, cached_current) = _contexts_cache
+        if time.monotonic() - cached_at < CONTEXTS_CACHE_TTL and cached_stamp == stamp:
+            return list(cached_contexts), cached_current
+
     try:
-        # Get all contexts
-        result = subprocess.run(
-            [KUBECTL, "config", "get-contexts", "-o", "name"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        contexts = [c.strip() for c in result.stdout.strip().split("\n") if c.strip()]
+        # The two lookups are independent, so fork both kubectl processes at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            contexts_future = executor.submit(_run_kubectl_config, "get-contexts", "-o", "name")
+            current_future = executor.submit(_run_kubectl_config, "current-context")
+            contexts_result = contexts_future.result()
+            current_result = current_future.result()
 
-        # Get current context
-        result = subprocess.run(
-            [KUBECTL, "config", "current-context"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        current = result.stdout.strip() if result.returncode == 0 else None
+        contexts = [c.strip() for c in contexts_result.stdout.strip().split("\n") if c.strip()]
+        current = current_result.stdout.strip() if current_result.returncode == 0 else None
 
+        _contexts_cache = (time.monotonic(), stamp, (list(contexts), current))
         return contexts, current
     except subprocess.TimeoutExpired:
         return [], None
@@ -60,6 +116,12 @@ def get_kubectl_contexts() -> tuple[list[str], str | None]:
         return [], None
 
 
+def reset_kubectl_contexts_cache() -> None:
+    """Drop cached kubectl contexts so the next lookup forks kubectl again."""
+    global _contexts_cache
+    _contexts_cache = None
+
+
 def context_exists(context: str) -> bool:
     """Check if a kubectl context exists.
 
@@ -84,29 +146,62 @@ def find_yaml_files(path: str) -> list[str]:
     """
     p = Path(path)
     if p.is_file():
-        if p.suffix in (".yaml", ".yml"):
+        if p.name.endswith(YAML_SUFFIXES):
             return [str(p)]
         return []
     elif p.is_dir():
-        files = []
-        for ext in ("*.yaml", "*.yml"):
-            files.extend([str(f) for f in p.rglob(ext)])
+        files = [
+            os.path.join(root, name)
+            for root, _dirs, names in os.walk(p)
+            for name in names
+            if name.endswith(YAML_SUFFIXES)
+        ]
         return sorted(files)
     return []
 
 
-def validate_manifest(file_path: str, context: str | None = None) -> ValidationResult:
+def is_client_only(file_path: str) -> bool:
+    """Check if every document in a manifest is a kind listed in CLIENT_ONLY_KINDS.
+
+    Args:
+        file_path: Path to the YAML manifest
+
+    Returns:
+        True if the file holds at least one document and all of them are
+        client-only kinds; False otherwise, including when it cannot be parsed
+    """
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            docs = [d for d in yaml.load_all(f, Loader=_LOADER) if d]
+    except (OSError, UnicodeDecodeError, yaml.YAMLError):
+        return False
+    return bool(docs) and all(
+        isinstance(d, dict) and (d.get("apiVersion"), d.get("kind")) in CLIENT_ONLY_KINDS for d in docs
+    )
+
+
+def validate_manifest(
+    file_path: str,
+    context: str | None = None,
+    strict: bool = True,
+) -> ValidationResult:
     """Run dry-run validation on a manifest file.
 
+    The server dry-run runs first; the client dry-run only runs when it fails,
+    to tell malformed manifests apart from ones the cluster rejects.
+
     Args:
         file_path: Path to the YAML manifest
         context: Optional kubectl context to use via --context flag (no global mutation)
+        strict: Always run the server dry-run. When False, manifests made up only of
+            CLIENT_ONLY_KINDS get a client dry-run only
 
     Returns:
         ValidationResult with pass/fail status and any errors
     """
     logger.debug("Validating manifest: %s", file_path)
-    dr = kubectl_dry_run(file_path, context=context)
+    server = strict or not is_client_only(file_path)
+    dr = kubectl_dry_run(file_path, context=context, fast=True, server=server)
     result = ValidationResult(
         file=file_path,
         client_passed=dr.client_passed,
@@ -114,6 +209,7 @@ def validate_manifest(file_path: str, context: str | None = None) -> ValidationR
         client_error=dr.client_error,
         server_error=dr.server_error,
         warnings=dr.warnings,
+        server_skipped=dr.server_skipped,
     )
     if not result.client_passed:
         logger.warning("Client dry-run failed for %s: %s", file_path, result.client_error)
@@ -124,25 +220,186 @@ def validate_manifest(file_path: str, context: str | None = None) -> ValidationR
     return result
 
 
-def validate_manifests(path: str, context: str | None = None) -> list[ValidationResult]:
+def validate_manifests(
+    path: str,
+    context: str | None = None,
+    strict: bool = True,
+) -> list[ValidationResult]:
     """Validate all manifests in a path.
 
+    Files are validated concurrently (up to PARALLELISM at a time); each worker
+    spends its time blocked on kubectl, so threads are sufficient.
+
     Args:
         path: File or directory path
         context: Optional kubectl context to use via --context flag (no global mutation)
+        strict: Always run the server dry-run (see validate_manifest)
 
     Returns:
-        List of ValidationResult for each file
+        List of ValidationResult for each file, in the same order as find_yaml_files
     """
     files = find_yaml_files(path)
     if not files:
         return []
+    return _validate_files(files, context, strict)
+
+
+def validate_manifests_iter(
+    path: str,
+    context: str | None = None,
+    strict: bool = True,
+) -> Iterator[ValidationResult]:
+    """Yield validation results for all manifests in a path as they complete.
 
-    results = []
-    for file in files:
-        result = validate_manifest(file, context=context)
-        results.append(result)
-    return results
+    Unlike validate_manifests, results arrive in completion order rather than
+    file order, so the first failure is available without waiting for the
+    slowest file. Closing the iterator early cancels files not yet started.
+
+    Args:
+        path: File or directory path
+        context: Optional kubectl context to use via --context flag (no global mutation)
+        strict: Always run the server dry-run (see validate_manifest)
+
+    Yields:
+        ValidationResult for each file, in completion order
+    """
+    files = find_yaml_files(path)
+    if not files:
+        return
+    executor = ThreadPoolExecutor(max_workers=min(PARALLELISM, len(files)))
+    try:
+        futures = [executor.submit(validate_manifest, f, context=context, strict=strict) for f in files]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _content_key(file_path: str) -> bytes | str:
+    """Return a digest of a file's content, or the path itself if it cannot be read."""
+    try:
+        return hashlib.blake2b(Path(file_path).read_bytes(), digest_size=16).digest()
+    except OSError:
+        return file_path
+
+
+def _for_duplicate(result: ValidationResult, file_path: str) -> ValidationResult:
+    """Copy a result onto a file with identical content.
+
+    kubectl names the source file in its messages (e.g. `error validating "dev.yaml"`),
+    so the validated file's path is swapped for the duplicate's in errors and warnings.
+    """
+
+    def rename(text: str | None) -> str | None:
+        return text.replace(result.file, file_path) if text else text
+
+    return replace(
+        result,
+        file=file_path,
+        client_error=rename(result.client_error),
+        server_error=rename(result.server_error),
+        warnings=[w.replace(result.file, file_path) for w in result.warnings] if result.warnings else result.warnings,
+    )
+
+
+def _validate_files(files: list[str], context: str | None, strict: bool = True) -> list[ValidationResult]:
+    """Validate each file individually, PARALLELISM files at a time.
+
+    Files with identical content (e.g. the same manifest copied across
+    environments) are dry-run once and share the result (see _for_duplicate).
+    """
+    groups: dict[bytes | str, list[str]] = {}
+    for f in files:
+        groups.setdefault(_content_key(f), []).append(f)
+    unique = [members[0] for members in groups.values()]
+    if len(unique) < len(files):
+        logger.debug("Validating %d unique manifests out of %d files", len(unique), len(files))
+
+    workers = min(PARALLELISM, len(unique))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda f: validate_manifest(f, context=context, strict=strict), unique))
+
+    by_file: dict[str, ValidationResult] = {}
+    for members, result in zip(groups.values(), results, strict=True):
+        by_file[members[0]] = result
+        for f in members[1:]:
+            by_file[f] = _for_duplicate(result, f)
+    return [by_file[f] for f in files]
+
+
+def _concat_manifests(contents: list[bytes]) -> bytes:
+    """Join manifest file contents into one multi-document YAML stream."""
+    # One growing buffer instead of a list of file contents plus their joined copy
+    buf = bytearray()
+    for i, content in enumerate(contents):
+        if i:
+            buf += b"---\n"
+        buf += content
+        if not buf.endswith(b"\n"):
+            buf += b"\n"
+    return bytes(buf)
+
+
+def validate_manifests_batched(
+    path: str,
+    context: str | None = None,
+    strict: bool = True,
+) -> list[ValidationResult]:
+    """Validate all manifests in a path with a single kubectl server dry-run.
+
+    All files are piped to kubectl as one multi-document stream. kubectl cannot
+    attribute errors or warnings to a source file when reading stdin, so if the
+    batch fails or reports warnings the files are re-validated individually,
+    unless kubectl itself is missing. Files without any YAML documents are left
+    out of the batch and validated on their own, since kubectl rejects them but
+    would not notice them inside a stream; so are client-only files when strict
+    is False. A single file is validated directly.
+
+    Args:
+        path: File or directory path
+        context: Optional kubectl context to use via --context flag (no global mutation)
+        strict: Always run the server dry-run (see validate_manifest)
+
+    Returns:
+        List of ValidationResult for each file, in the same order as find_yaml_files
+    """
+    files = find_yaml_files(path)
+    if len(files) < 2:
+        return _validate_files(files, context, strict) if files else []
+
+    try:
+        contents = [Path(f).read_bytes() for f in files]
+    except OSError as e:
+        logger.debug("Cannot batch manifests (%s), validating per file", e)
+        return _validate_files(files, context, strict)
+
+    batch = [
+        (f, c)
+        for f, c in zip(files, contents, strict=True)
+        if count_documents(c) and (strict or not is_client_only(f))
+    ]
+    if len(batch) < 2:
+        return _validate_files(files, context, strict)
+
+    # The server dry-run covers everything the client one checks, so a clean
+    # batch needs a single kubectl process; failures are re-run per file anyway
+    dr = kubectl_dry_run(context=context, stdin_data=_concat_manifests([c for _, c in batch]), fast=True)
+    if dr.client_error == KUBECTL_NOT_FOUND:
+        # Every per-file retry would fail the same way
+        return [
+            ValidationResult(file=f, client_passed=False, server_passed=False, client_error=dr.client_error)
+            for f in files
+        ]
+    if not (dr.client_passed and dr.server_passed and not dr.warnings):
+        logger.debug("Batched dry-run reported problems, validating %d files individually", len(files))
+        return _validate_files(files, context, strict)
+
+    logger.debug("Batched dry-run passed for %d files", len(batch))
+    by_file = {f: ValidationResult(file=f, client_passed=True, server_passed=True) for f, _ in batch}
+    rest = [f for f in files if f not in by_file]
+    if rest:
+        by_file.update(zip(rest, _validate_files(rest, context, strict), strict=True))
+    return [by_file[f] for f in files]
 
 
 def run_flux_check(context: str | None = None) -> tuple[bool, str]:
@@ -160,6 +417,7 @@ def run_flux_check(context: str | None = None) -> tuple[bool, str]:
         result = subprocess.run(
             [FLUX, *ctx_args, "check"],
             capture_output=True,
+            close_fds=False,
             text=True,
             timeout=FLUX_TIMEOUT,
         )
@@ -188,6 +446,7 @@ def get_flux_status(context: str | None = None) -> tuple[bool, str]:
         result = subprocess.run(
             [FLUX, *ctx_args, "get", "all", "-A"],
             capture_output=True,
+            close_fds=False,
             text=True,
             timeout=FLUX_TIMEOUT,
         )
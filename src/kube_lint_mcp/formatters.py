@@ -26,21 +26,30 @@ def format_step(
     error: str | None = None,
     warnings: list[str] | None = None,
     pass_detail: str | None = None,
+    indent: str = "",
 ) -> list[str]:
-    """Return output lines for a single validation step."""
+    """Return output lines for a single validation step, each prefixed with indent."""
     if passed:
         if pass_detail:
-            lines = [f"{name}: PASS ({pass_detail})"]
+            lines = [f"{indent}{name}: PASS ({pass_detail})"]
         elif warnings:
-            lines = [f"{name}: PASS (with warnings)"]
+            lines = [f"{indent}{name}: PASS (with warnings)"]
             for w in warnings:
-                lines.append(f"  Warning: {w}")
+                lines.append(f"{indent}  Warning: {w}")
         else:
-            lines = [f"{name}: PASS"]
+            lines = [f"{indent}{name}: PASS"]
     else:
-        lines = [f"{name}: FAIL"]
+        lines = [f"{indent}{name}: FAIL"]
         if error:
-            lines.append(f"  Error: {error}")
+            lines.append(f"{indent}  Error: {error}")
+    return lines
+
+
+def _make_header(title: str, *fields: tuple[str, str | None]) -> list[str]:
+    """Return the title, a "Label: value" line per field that has a value, and the separator."""
+    lines = [title]
+    lines.extend(f"{label}: {value}" for label, value in fields if value)
+    lines.extend([SEPARATOR, ""])
     return lines
 
 
@@ -80,13 +89,7 @@ def format_flux_results(
     path: str,
 ) -> str:
     """Format flux dry-run validation results into output text."""
-    lines = [
-        "FluxCD Dry-Run Validation",
-        f"Context: {context}",
-        f"Path: {path}",
-        SEPARATOR,
-        "",
-    ]
+    lines = _make_header("FluxCD Dry-Run Validation", ("Context", context), ("Path", path))
 
     passed = 0
     failed = 0
@@ -97,19 +100,19 @@ def format_flux_results(
         if r.client_passed:
             lines.append(f"  {LABEL_CLIENT_DRYRUN}: PASS")
         else:
-            step = format_step(LABEL_CLIENT_DRYRUN, False, r.client_error)
-            lines.extend(["  " + ln for ln in step])
+            lines.extend(format_step(LABEL_CLIENT_DRYRUN, False, r.client_error, indent="  "))
             failed += 1
             lines.append("")
             continue
 
-        if r.server_passed:
-            step = format_step(LABEL_SERVER_DRYRUN, True, warnings=r.warnings)
-            lines.extend(["  " + ln for ln in step])
+        if r.server_skipped:
+            lines.append(f"  {LABEL_SERVER_DRYRUN}: SKIPPED (built-in kinds only)")
+            passed += 1
+        elif r.server_passed:
+            lines.extend(format_step(LABEL_SERVER_DRYRUN, True, warnings=r.warnings, indent="  "))
             passed += 1
         else:
-            step = format_step(LABEL_SERVER_DRYRUN, False, r.server_error)
-            lines.extend(["  " + ln for ln in step])
+            lines.extend(format_step(LABEL_SERVER_DRYRUN, False, r.server_error, indent="  "))
             failed += 1
 
         lines.append("")
@@ -124,13 +127,7 @@ def format_kustomize_result(
     path: str,
 ) -> str:
     """Format kustomize validation result into output text."""
-    lines = [
-        "Kustomize Dry-Run Validation",
-        f"Context: {context}",
-        f"Path: {path}",
-        SEPARATOR,
-        "",
-    ]
+    lines = _make_header("Kustomize Dry-Run Validation", ("Context", context), ("Path", path))
 
     steps = [
         Step(
@@ -161,16 +158,13 @@ def format_helm_result(
     namespace: str | None,
 ) -> str:
     """Format helm chart validation result into output text."""
-    lines = [
+    lines = _make_header(
         "Helm Chart Dry-Run Validation",
-        f"Context: {context}",
-        f"Chart: {chart_path}",
-    ]
-    if values_file:
-        lines.append(f"Values: {values_file}")
-    if namespace:
-        lines.append(f"Namespace: {namespace}")
-    lines.extend([SEPARATOR, ""])
+        ("Context", context),
+        ("Chart", chart_path),
+        ("Values", values_file),
+        ("Namespace", namespace),
+    )
 
     steps = [
         Step("Helm lint", result.lint_passed, result.lint_error),
@@ -188,10 +182,9 @@ def format_helm_result(
             warnings=result.warnings,
         ),
     ]
-    step_lines, _passed, failed = render_steps(steps)
+    step_lines, passed, failed = render_steps(steps)
     lines.extend(step_lines)
-    lines.append(SEPARATOR)
-    lines.append(MSG_DO_NOT_COMMIT if failed else MSG_SAFE_TO_COMMIT)
+    lines.extend(format_summary(passed, failed))
     return "\n".join(lines)
 
 
@@ -222,15 +215,12 @@ def format_kubeconform_result(
     strict: bool,
 ) -> str:
     """Format kubeconform validation result into output text."""
-    lines = [
+    lines = _make_header(
         "Kubeconform Schema Validation",
-        f"Path: {path}",
-    ]
-    if kubernetes_version != "master":
-        lines.append(f"Kubernetes version: {kubernetes_version}")
-    if strict:
-        lines.append("Strict mode: enabled")
-    lines.extend([SEPARATOR, ""])
+        ("Path", path),
+        ("Kubernetes version", kubernetes_version if kubernetes_version != "master" else None),
+        ("Strict mode", "enabled" if strict else None),
+    )
 
     if not result.resources:
         lines.append("No resources found to validate.")
@@ -271,12 +261,7 @@ def format_yaml_result(
     path: str,
 ) -> str:
     """Format YAML validation result into output text."""
-    lines = [
-        "YAML Syntax Validation",
-        f"Path: {path}",
-        SEPARATOR,
-        "",
-    ]
+    lines = _make_header("YAML Syntax Validation", ("Path", path))
 
     if not result.files:
         lines.append("No YAML files found.")
@@ -305,13 +290,7 @@ def format_argocd_app_list_result(
     namespace: str | None,
 ) -> str:
     """Format ArgoCD app list result into output text."""
-    lines = [
-        "ArgoCD Application List",
-        f"Context: {context}",
-    ]
-    if namespace:
-        lines.append(f"Namespace: {namespace}")
-    lines.extend([SEPARATOR, ""])
+    lines = _make_header("ArgoCD Application List", ("Context", context), ("Namespace", namespace))
 
     if not result.apps:
         lines.append("No ArgoCD applications found.")
@@ -337,12 +316,8 @@ def format_argocd_app_get_result(
     context: str,
 ) -> str:
     """Format ArgoCD app get result into output text."""
-    lines = [
-        "ArgoCD Application Detail",
-        f"Context: {context}",
-        f"Application: {result.name}",
-        SEPARATOR,
-        "",
+    lines = _make_header("ArgoCD Application Detail", ("Context", context), ("Application", result.name))
+    lines += [
         f"  Project: {result.project}",
         f"  Namespace: {result.namespace}",
         f"  Sync Status: {result.sync_status}",
@@ -387,13 +362,7 @@ def format_argocd_app_diff_result(
     app_name: str,
 ) -> str:
     """Format ArgoCD app diff result into output text."""
-    lines = [
-        "ArgoCD Application Diff",
-        f"Context: {context}",
-        f"Application: {app_name}",
-        SEPARATOR,
-        "",
-    ]
+    lines = _make_header("ArgoCD Application Diff", ("Context", context), ("Application", app_name))
 
     if result.in_sync:
         lines.append("Application is IN SYNC - no differences between live and desired state.")
@@ -4,20 +4,20 @@ import logging
 import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
-
-from kube_lint_mcp.dryrun import kubectl_dry_run
+from kube_lint_mcp.dryrun import count_documents, kubectl_dry_run
 
 logger = logging.getLogger(__name__)
 
 HELM = shutil.which("helm") or "helm"
 HELM_TIMEOUT = int(os.getenv("KUBE_LINT_HELM_TIMEOUT", "60"))
+CHART_FILENAMES = frozenset({"Chart.yaml", "chart.yaml"})
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HelmValidationResult:
     """Result of Helm chart validation."""
 
@@ -46,10 +46,17 @@ def is_helm_chart(path: str) -> bool:
     p = Path(path)
     if p.is_file():
         # Check if parent directory is a chart
-        return (p.parent / "Chart.yaml").exists() or (p.parent / "chart.yaml").exists()
+        chart_dir = p.parent
     elif p.is_dir():
-        return (p / "Chart.yaml").exists() or (p / "chart.yaml").exists()
-    return False
+        chart_dir = p
+    else:
+        return False
+    # One directory read instead of a stat() per candidate name
+    try:
+        with os.scandir(chart_dir) as entries:
+            return any(entry.name in CHART_FILENAMES for entry in entries)
+    except OSError:
+        return False
 
 
 def validate_helm_chart(
@@ -81,17 +88,31 @@ def validate_helm_chart(
             lint_error="Path is not a Helm chart (missing Chart.yaml)",
         )
 
-    # Step 1: Run helm lint (no context needed, local-only)
+    # Steps 1 and 2: helm lint and helm template are both local-only and
+    # independent of each other, so they run concurrently. Rendered output
+    # stays bytes: it is only counted and piped to kubectl, never shown.
     lint_cmd = [HELM, "lint", chart_path]
+    render_cmd = [HELM, "template", release_name, chart_path]
     if values_file:
         lint_cmd.extend(["-f", values_file])
+        render_cmd.extend(["-f", values_file])
+    if namespace:
+        render_cmd.extend(["--namespace", namespace])
 
-    logger.debug("Running helm lint: %s", " ".join(lint_cmd))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running helm lint: %s", " ".join(lint_cmd))
+        logger.debug("Running helm template: %s", " ".join(render_cmd))
 
-    try:
-        lint_result = subprocess.run(
-            lint_cmd, capture_output=True, text=True, timeout=HELM_TIMEOUT
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        lint_future = executor.submit(
+            lambda: subprocess.run(lint_cmd, capture_output=True, close_fds=False, text=True, timeout=HELM_TIMEOUT)
         )
+        render_future = executor.submit(
+            lambda: subprocess.run(render_cmd, capture_output=True, close_fds=False, timeout=HELM_TIMEOUT)
+        )
+
+    try:
+        lint_result = lint_future.result()
     except FileNotFoundError:
         logger.error("helm not found on PATH")
         return HelmValidationResult(
@@ -116,19 +137,8 @@ def validate_helm_chart(
     lint_passed = lint_result.returncode == 0
     lint_error = lint_result.stderr.strip() if not lint_passed else None
 
-    # Step 2: Render chart with helm template (no context needed, local-only)
-    render_cmd = [HELM, "template", release_name, chart_path]
-    if values_file:
-        render_cmd.extend(["-f", values_file])
-    if namespace:
-        render_cmd.extend(["--namespace", namespace])
-
-    logger.debug("Running helm template: %s", " ".join(render_cmd))
-
     try:
-        render_result = subprocess.run(
-            render_cmd, capture_output=True, text=True, timeout=HELM_TIMEOUT
-        )
+        render_result = render_future.result()
     except FileNotFoundError:
         logger.error("helm not found on PATH")
         return HelmValidationResult(
@@ -153,7 +163,7 @@ def validate_helm_chart(
         )
 
     render_passed = render_result.returncode == 0
-    render_error = render_result.stderr.strip() if not render_passed else None
+    render_error = render_result.stderr.decode("utf-8", errors="replace").strip() if not render_passed else None
 
     if not render_passed:
         return HelmValidationResult(
@@ -166,23 +176,13 @@ def validate_helm_chart(
             render_error=render_error,
         )
 
-    # Count resources in rendered output
-    try:
-        rendered_manifests = list(yaml.safe_load_all(render_result.stdout))
-        resource_count = len([m for m in rendered_manifests if m])
-    except yaml.YAMLError as e:
-        return HelmValidationResult(
-            chart_path=chart_path,
-            lint_passed=lint_passed,
-            render_passed=True,
-            client_passed=False,
-            server_passed=False,
-            lint_error=lint_error,
-            render_error=f"Failed to parse rendered YAML: {e}",
-        )
+    # Count resources in rendered output. Malformed YAML is left to the
+    # kubectl client dry-run below, which reports it against the manifest.
+    resource_count = count_documents(render_result.stdout)
 
-    # Step 3: Validate rendered manifests with kubectl via stdin
-    dr = kubectl_dry_run(context=context, stdin_data=render_result.stdout)
+    # Step 3: Validate rendered manifests with kubectl via stdin, as raw bytes,
+    # running the client and server dry-runs concurrently
+    dr = kubectl_dry_run(context=context, stdin_data=render_result.stdout, parallel=True)
     return HelmValidationResult(
         chart_path=chart_path,
         lint_passed=lint_passed,
@@ -4,16 +4,34 @@ import json
 import logging
 import os
 import shutil
+import stat
 import subprocess
+from collections import Counter
 from dataclasses import dataclass, field
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    from json import loads as json_loads  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 KUBECONFORM = shutil.which("kubeconform") or "kubeconform"
 KUBECONFORM_TIMEOUT = int(os.getenv("KUBE_LINT_KUBECONFORM_TIMEOUT", "120"))
-
-
-@dataclass
+# Files kubeconform validates concurrently (its own default is 4)
+KUBECONFORM_WORKERS = max(1, int(os.getenv("KUBE_LINT_KUBECONFORM_WORKERS", str(os.cpu_count() or 4))))
+# Downloaded JSON schemas are kept here between runs; an empty value disables the cache
+KUBECONFORM_CACHE = os.getenv(
+    "KUBE_LINT_KUBECONFORM_CACHE",
+    os.path.join(
+        os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "kube-lint-mcp",
+        "kubeconform",
+    ),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class KubeconformResourceResult:
     """Result for a single validated resource."""
 
@@ -25,7 +43,7 @@ class KubeconformResourceResult:
     msg: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KubeconformResult:
     """Overall result of kubeconform validation."""
 
@@ -39,6 +57,28 @@ class KubeconformResult:
     error: str | None = None
 
 
+def _prepare_cache_dir(path: str) -> bool:
+    """Create the schema cache directory and check that it is private to this user.
+
+    kubeconform trusts cached schemas, so a directory another user owns or can
+    write to could feed it permissive schemas and make invalid manifests pass.
+    """
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        st = os.lstat(path)
+    except OSError as e:
+        logger.warning("Cannot create kubeconform schema cache %s: %s", path, e)
+        return False
+    getuid = getattr(os, "getuid", None)
+    if not stat.S_ISDIR(st.st_mode) or (getuid is not None and st.st_uid != getuid()):
+        logger.warning("Not using kubeconform schema cache %s: not a directory owned by the current user", path)
+        return False
+    if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        logger.warning("Not using kubeconform schema cache %s: writable by other users", path)
+        return False
+    return True
+
+
 def _make_resource(r: dict[str, str]) -> KubeconformResourceResult:
     """Create a KubeconformResourceResult from a parsed JSON dict."""
     return KubeconformResourceResult(
@@ -62,7 +102,7 @@ def _parse_output(stdout: str) -> list[KubeconformResourceResult]:
 
     # Try wrapped JSON first
     try:
-        data = json.loads(stdout)
+        data = json_loads(stdout)
         if isinstance(data, dict) and "resources" in data:
             return [_make_resource(r) for r in data["resources"]]
     except (json.JSONDecodeError, TypeError):
@@ -75,7 +115,7 @@ def _parse_output(stdout: str) -> list[KubeconformResourceResult]:
         if not line:
             continue
         try:
-            r = json.loads(line)
+            r = json_loads(line)
             if isinstance(r, dict) and "filename" in r:
                 resources.append(_make_resource(r))
         except (json.JSONDecodeError, TypeError):
@@ -95,7 +135,7 @@ def _parse_summary(stdout: str) -> dict[str, int] | None:
         return None
 
     try:
-        data = json.loads(stdout)
+        data = json_loads(stdout)
     except (json.JSONDecodeError, TypeError):
         return None
 
@@ -127,6 +167,7 @@ def validate_manifests(
         "-summary",
         "-verbose",
         "-ignore-missing-schemas",
+        "-n", str(KUBECONFORM_WORKERS),
     ]
 
     if kubernetes_version != "master":
@@ -135,14 +176,19 @@ def validate_manifests(
     if strict:
         cmd.append("-strict")
 
+    if KUBECONFORM_CACHE and _prepare_cache_dir(KUBECONFORM_CACHE):
+        cmd.extend(["-cache", KUBECONFORM_CACHE])
+
     cmd.append(path)
 
-    logger.debug("Running kubeconform: %s", " ".join(cmd))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running kubeconform: %s", " ".join(cmd))
 
     try:
         proc = subprocess.run(
             cmd,
             capture_output=True,
+            close_fds=False,
             text=True,
             timeout=KUBECONFORM_TIMEOUT,
         )
@@ -170,10 +216,11 @@ def validate_manifests(
         errors = summary.get("errors", 0)
         skipped = summary.get("skipped", 0)
     else:
-        valid = sum(1 for r in resources if r.status == "statusValid")
-        invalid = sum(1 for r in resources if r.status == "statusInvalid")
-        errors = sum(1 for r in resources if r.status == "statusError")
-        skipped = sum(1 for r in resources if r.status == "statusSkipped")
+        counts = Counter(r.status for r in resources)
+        valid = counts["statusValid"]
+        invalid = counts["statusInvalid"]
+        errors = counts["statusError"]
+        skipped = counts["statusSkipped"]
 
     passed = invalid == 0 and errors == 0
 
@@ -1,14 +1,13 @@
 """Kustomize overlay validation utilities."""
 
 import logging
+import os
 import shutil
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
-
-from kube_lint_mcp.dryrun import KUBECTL_TIMEOUT, kubectl_dry_run
+from kube_lint_mcp.dryrun import KUBECTL_TIMEOUT, count_documents, kubectl_dry_run
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +16,7 @@ KUBECTL = shutil.which("kubectl") or "kubectl"
 KUSTOMIZATION_FILENAMES = ("kustomization.yaml", "kustomization.yml", "Kustomization")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KustomizeValidationResult:
     """Result of Kustomize overlay validation."""
 
@@ -45,7 +44,12 @@ def is_kustomization(path: str) -> bool:
     if p.is_file():
         return p.name in KUSTOMIZATION_FILENAMES
     elif p.is_dir():
-        return any((p / name).exists() for name in KUSTOMIZATION_FILENAMES)
+        # One directory read instead of a stat() per candidate name
+        try:
+            with os.scandir(p) as entries:
+                return any(entry.name in KUSTOMIZATION_FILENAMES for entry in entries)
+        except OSError:
+            return False
     return False
 
 
@@ -72,11 +76,11 @@ def validate_kustomization(
         build_result = subprocess.run(
             [KUBECTL, "kustomize", kustomize_dir],
             capture_output=True,
-            text=True,
+            close_fds=False,
             timeout=KUBECTL_TIMEOUT,
         )
         build_passed = build_result.returncode == 0
-        build_error = build_result.stderr.strip() if not build_passed else None
+        build_error = build_result.stderr.decode("utf-8", errors="replace").strip() if not build_passed else None
 
         if not build_passed:
             logger.debug("Kustomize build failed: %s", build_error)
@@ -88,21 +92,12 @@ def validate_kustomization(
                 build_error=build_error,
             )
 
-        # Count resources in rendered output
-        try:
-            rendered_manifests = list(yaml.safe_load_all(build_result.stdout))
-            resource_count = len([m for m in rendered_manifests if m])
-        except yaml.YAMLError as e:
-            return KustomizeValidationResult(
-                path=path,
-                build_passed=True,
-                client_passed=False,
-                server_passed=False,
-                build_error=f"Failed to parse rendered YAML: {e}",
-            )
+        # Malformed output is left to the kubectl client dry-run to report
+        resource_count = count_documents(build_result.stdout)
 
-        # Step 2: Validate rendered manifests with kubectl dry-run via stdin
-        dr = kubectl_dry_run(context=context, stdin_data=build_result.stdout)
+        # Step 2: Validate rendered manifests with kubectl dry-run via stdin, as raw bytes,
+        # running the client and server dry-runs concurrently
+        dr = kubectl_dry_run(context=context, stdin_data=build_result.stdout, parallel=True)
         return KustomizeValidationResult(
             path=path,
             build_passed=True,
@@ -2,10 +2,10 @@
 
 import asyncio
 import logging
+import os
 import sys
 import time
 from collections.abc import Callable, Sequence
-from pathlib import Path
 from typing import Any
 
 try:
@@ -47,268 +47,280 @@ def _text(msg: str) -> list[TextContent]:
 
 def _normalize_path(path: str) -> str:
     """Expand ~ and resolve relative paths."""
-    return str(Path(path).expanduser().resolve())
+    return os.path.realpath(os.path.expanduser(path))
 
 
 # ---------------------------------------------------------------------------
 # Tool listing
 # ---------------------------------------------------------------------------
 
-@app.list_tools()  # type: ignore[no-untyped-call,untyped-decorator]
-async def list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="select_kube_context",
-            description=(
-                "Select the Kubernetes context for all subsequent operations.\n"
-                "MUST be called before using any other tool.\n"
-                "Does NOT mutate global kubeconfig — context is held in memory only.\n"
-                "IMPORTANT: Do NOT call this automatically.\n"
-                "Always list contexts first and ask the user which context to use."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "context": {
-                        "type": "string",
-                        "description": "Name of the kubectl context to use",
-                    }
-                },
-                "required": ["context"],
+# Tool definitions never change, so they are built once at import
+_TOOLS: list[Tool] = [
+    Tool(
+        name="select_kube_context",
+        description=(
+            "Select the Kubernetes context for all subsequent operations.\n"
+            "MUST be called before using any other tool.\n"
+            "Does NOT mutate global kubeconfig — context is held in memory only.\n"
+            "IMPORTANT: Do NOT call this automatically.\n"
+            "Always list contexts first and ask the user which context to use."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "context": {
+                    "type": "string",
+                    "description": "Name of the kubectl context to use",
+                }
             },
+            "required": ["context"],
+        },
+    ),
+    Tool(
+        name="list_kube_contexts",
+        description=(
+            "List available kubectl contexts.\n"
+            "Use this to see available contexts, then ALWAYS present the list\n"
+            "to the user and ask them which context they want to use before\n"
+            "calling select_kube_context.\n"
+            "NEVER automatically select a context without user confirmation."
         ),
-        Tool(
-            name="list_kube_contexts",
-            description=(
-                "List available kubectl contexts.\n"
-                "Use this to see available contexts, then ALWAYS present the list\n"
-                "to the user and ask them which context they want to use before\n"
-                "calling select_kube_context.\n"
-                "NEVER automatically select a context without user confirmation."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    Tool(
+        name="flux_dryrun",
+        description=(
+            "Validate FluxCD manifests with kubectl dry-run (client + server).\n"
+            "ALWAYS use this before committing Flux YAML files\n"
+            "to prevent GitOps reconciliation failures.\n"
+            "Requires select_kube_context to be called first."
         ),
-        Tool(
-            name="flux_dryrun",
-            description=(
-                "Validate FluxCD manifests with kubectl dry-run (client + server).\n"
-                "ALWAYS use this before committing Flux YAML files\n"
-                "to prevent GitOps reconciliation failures.\n"
-                "Requires select_kube_context to be called first."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to YAML file or directory containing manifests (required)",
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to YAML file or directory containing manifests (required)",
+                },
+                "strict": {
+                    "type": "boolean",
+                    "description": (
+                        "Run the server dry-run for every file. When false, files made up"
+                        " only of built-in kinds (ConfigMap, Deployment, ...) get a client"
+                        " dry-run only (default: true)"
+                    ),
                 },
-                "required": ["path"],
             },
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="flux_check",
+        description=(
+            "Run 'flux check' to verify Flux installation and components health.\n"
+            "Requires select_kube_context to be called first."
         ),
-        Tool(
-            name="flux_check",
-            description=(
-                "Run 'flux check' to verify Flux installation and components health.\n"
-                "Requires select_kube_context to be called first."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    Tool(
+        name="flux_status",
+        description=(
+            "Get Flux reconciliation status for all resources across namespaces.\n"
+            "Requires select_kube_context to be called first."
         ),
-        Tool(
-            name="flux_status",
-            description=(
-                "Get Flux reconciliation status for all resources across namespaces.\n"
-                "Requires select_kube_context to be called first."
-            ),
-            inputSchema={"type": "object", "properties": {}, "required": []},
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    Tool(
+        name="kustomize_dryrun",
+        description=(
+            "Validate Kustomize overlay by building and running kubectl dry-run\n"
+            "(client + server).\n"
+            "ALWAYS use this before committing Kustomize overlay changes\n"
+            "to prevent deployment failures.\n"
+            "Requires select_kube_context to be called first."
         ),
-        Tool(
-            name="kustomize_dryrun",
-            description=(
-                "Validate Kustomize overlay by building and running kubectl dry-run\n"
-                "(client + server).\n"
-                "ALWAYS use this before committing Kustomize overlay changes\n"
-                "to prevent deployment failures.\n"
-                "Requires select_kube_context to be called first."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": (
-                            "Path to directory containing kustomization.yaml"
-                            " or path to kustomization.yaml file (required)"
-                        ),
-                    }
-                },
-                "required": ["path"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": (
+                        "Path to directory containing kustomization.yaml"
+                        " or path to kustomization.yaml file (required)"
+                    ),
+                }
             },
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="helm_dryrun",
+        description=(
+            "Validate Helm chart by rendering and running kubectl dry-run\n"
+            "(client + server).\n"
+            "ALWAYS use this before committing Helm chart changes\n"
+            "to prevent deployment failures.\n"
+            "Requires select_kube_context to be called first."
         ),
-        Tool(
-            name="helm_dryrun",
-            description=(
-                "Validate Helm chart by rendering and running kubectl dry-run\n"
-                "(client + server).\n"
-                "ALWAYS use this before committing Helm chart changes\n"
-                "to prevent deployment failures.\n"
-                "Requires select_kube_context to be called first."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "chart_path": {
-                        "type": "string",
-                        "description": "Path to Helm chart directory (required)",
-                    },
-                    "values_file": {
-                        "type": "string",
-                        "description": "Path to values file (optional)",
-                    },
-                    "namespace": {
-                        "type": "string",
-                        "description": "Namespace for rendering (optional)",
-                    },
-                    "release_name": {
-                        "type": "string",
-                        "description": "Release name for helm template (default: 'release-name')",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "chart_path": {
+                    "type": "string",
+                    "description": "Path to Helm chart directory (required)",
+                },
+                "values_file": {
+                    "type": "string",
+                    "description": "Path to values file (optional)",
+                },
+                "namespace": {
+                    "type": "string",
+                    "description": "Namespace for rendering (optional)",
+                },
+                "release_name": {
+                    "type": "string",
+                    "description": "Release name for helm template (default: 'release-name')",
                 },
-                "required": ["chart_path"],
             },
+            "required": ["chart_path"],
+        },
+    ),
+    Tool(
+        name="kubeconform_validate",
+        description=(
+            "Validate Kubernetes manifests against JSON schemas offline\n"
+            "using kubeconform. Catches invalid fields, type mismatches,\n"
+            "and missing required fields without a live cluster.\n"
+            "Does NOT require select_kube_context."
         ),
-        Tool(
-            name="kubeconform_validate",
-            description=(
-                "Validate Kubernetes manifests against JSON schemas offline\n"
-                "using kubeconform. Catches invalid fields, type mismatches,\n"
-                "and missing required fields without a live cluster.\n"
-                "Does NOT require select_kube_context."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Path to YAML file or directory containing manifests (required)",
-                    },
-                    "kubernetes_version": {
-                        "type": "string",
-                        "description": (
-                            "Kubernetes version for schema lookup"
-                            " (e.g. '1.29.0'). Default: 'master'"
-                        ),
-                    },
-                    "strict": {
-                        "type": "boolean",
-                        "description": (
-                            "Reject additional properties not in the schema"
-                            " (default: false)"
-                        ),
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Path to YAML file or directory containing manifests (required)",
+                },
+                "kubernetes_version": {
+                    "type": "string",
+                    "description": (
+                        "Kubernetes version for schema lookup"
+                        " (e.g. '1.29.0'). Default: 'master'"
+                    ),
+                },
+                "strict": {
+                    "type": "boolean",
+                    "description": (
+                        "Reject additional properties not in the schema"
+                        " (default: false)"
+                    ),
                 },
-                "required": ["path"],
             },
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="yaml_validate",
+        description=(
+            "Validate YAML syntax of Kubernetes manifest files.\n"
+            "Catches syntax errors, duplicate keys, and tab indentation.\n"
+            "Use this as a first-pass check before kubeconform or dry-run.\n"
+            "Does NOT require select_kube_context."
         ),
-        Tool(
-            name="yaml_validate",
-            description=(
-                "Validate YAML syntax of Kubernetes manifest files.\n"
-                "Catches syntax errors, duplicate keys, and tab indentation.\n"
-                "Use this as a first-pass check before kubeconform or dry-run.\n"
-                "Does NOT require select_kube_context."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": (
-                            "Path to YAML file or directory containing"
-                            " YAML files (required)"
-                        ),
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": (
+                        "Path to YAML file or directory containing"
+                        " YAML files (required)"
+                    ),
                 },
-                "required": ["path"],
             },
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="argocd_app_list",
+        description=(
+            "List all ArgoCD applications with sync and health status.\n"
+            "Reads Application CRs via kubectl (kubeconfig only, no ArgoCD CLI or server auth needed).\n"
+            "Requires select_kube_context to be called first."
         ),
-        Tool(
-            name="argocd_app_list",
-            description=(
-                "List all ArgoCD applications with sync and health status.\n"
-                "Uses --core mode (kubeconfig only, no ArgoCD server auth needed).\n"
-                "Requires select_kube_context to be called first."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "namespace": {
-                        "type": "string",
-                        "description": (
-                            "Namespace where ArgoCD Application CRs live (optional)."
-                            " Common values: 'argocd', 'argo-cd'"
-                        ),
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "namespace": {
+                    "type": "string",
+                    "description": (
+                        "Namespace where ArgoCD Application CRs live (optional)."
+                        " Common values: 'argocd', 'argo-cd'"
+                    ),
                 },
-                "required": [],
             },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="argocd_app_get",
+        description=(
+            "Get detailed status of a single ArgoCD application including\n"
+            "sync/health status, conditions, and resource statuses.\n"
+            "Reads the Application CR via kubectl (kubeconfig only, no ArgoCD CLI or server auth needed).\n"
+            "Requires select_kube_context to be called first."
         ),
-        Tool(
-            name="argocd_app_get",
-            description=(
-                "Get detailed status of a single ArgoCD application including\n"
-                "sync/health status, conditions, and resource statuses.\n"
-                "Uses --core mode (kubeconfig only, no ArgoCD server auth needed).\n"
-                "Requires select_kube_context to be called first."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "app_name": {
-                        "type": "string",
-                        "description": "Name of the ArgoCD Application (required)",
-                    },
-                    "namespace": {
-                        "type": "string",
-                        "description": (
-                            "Namespace where the Application CR lives (optional)."
-                            " Common values: 'argocd', 'argo-cd'"
-                        ),
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "app_name": {
+                    "type": "string",
+                    "description": "Name of the ArgoCD Application (required)",
+                },
+                "namespace": {
+                    "type": "string",
+                    "description": (
+                        "Namespace where the Application CR lives (optional)."
+                        " Common values: 'argocd', 'argo-cd'"
+                    ),
                 },
-                "required": ["app_name"],
             },
+            "required": ["app_name"],
+        },
+    ),
+    Tool(
+        name="argocd_app_diff",
+        description=(
+            "Show diff between live and desired state of an ArgoCD application.\n"
+            "Returns unified diff output showing what would change on sync.\n"
+            "Exit 0 = in sync, exit 1 = has diff, exit 2 = error.\n"
+            "Uses --core mode (kubeconfig only, no ArgoCD server auth needed).\n"
+            "Requires select_kube_context to be called first."
         ),
-        Tool(
-            name="argocd_app_diff",
-            description=(
-                "Show diff between live and desired state of an ArgoCD application.\n"
-                "Returns unified diff output showing what would change on sync.\n"
-                "Exit 0 = in sync, exit 1 = has diff, exit 2 = error.\n"
-                "Uses --core mode (kubeconfig only, no ArgoCD server auth needed).\n"
-                "Requires select_kube_context to be called first."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "app_name": {
-                        "type": "string",
-                        "description": "Name of the ArgoCD Application (required)",
-                    },
-                    "namespace": {
-                        "type": "string",
-                        "description": (
-                            "Namespace where the Application CR lives (optional)."
-                            " Common values: 'argocd', 'argo-cd'"
-                        ),
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "app_name": {
+                    "type": "string",
+                    "description": "Name of the ArgoCD Application (required)",
+                },
+                "namespace": {
+                    "type": "string",
+                    "description": (
+                        "Namespace where the Application CR lives (optional)."
+                        " Common values: 'argocd', 'argo-cd'"
+                    ),
                 },
-                "required": ["app_name"],
             },
-        ),
-    ]
+            "required": ["app_name"],
+        },
+    ),
+]
+
+
+@app.list_tools()  # type: ignore[no-untyped-call,untyped-decorator]
+async def list_tools() -> list[Tool]:
+    """List available tools."""
+    return _TOOLS
 
 
 def _require_context() -> list[TextContent] | str:
@@ -408,8 +420,12 @@ def _handle_flux_dryrun(arguments: dict[str, Any]) -> list[TextContent]:
     if not path:
         return _text(_ERR_PATH_REQUIRED)
     path = _normalize_path(path)
+    strict = arguments.get("strict", True)
 
-    results = flux_lint.validate_manifests(path, context=ctx)
+    if flux_lint.BATCH_DRYRUN:
+        results = flux_lint.validate_manifests_batched(path, context=ctx, strict=strict)
+    else:
+        results = flux_lint.validate_manifests(path, context=ctx, strict=strict)
 
     if not results:
         return _text(f"No YAML files found in: {path}")
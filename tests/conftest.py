@@ -1,6 +1,6 @@
 import pytest
 
-from kube_lint_mcp import server
+from kube_lint_mcp import argocd_lint, flux_lint, server
 
 
 @pytest.fixture(autouse=True)
@@ -11,3 +11,20 @@ def reset_selected_context():
     yield
     server._selected_context = None
     server._contexts_listed_at = None
+
+
+@pytest.fixture(autouse=True)
+def reset_argocd_namespace_cache():
+    """Reset cached ArgoCD namespace detection between tests."""
+    argocd_lint.reset_argocd_namespace_cache()
+    yield
+    argocd_lint.reset_argocd_namespace_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_kubectl_contexts_cache():
+    """Reset cached kubectl contexts between tests."""
+    flux_lint.reset_kubectl_contexts_cache()
+    yield
+    flux_lint.reset_kubectl_contexts_cache()
+
@@ -0,0 +1,28 @@
+"""Shared fakes for tests that stub out subprocess.run."""
+
+import subprocess
+
+
+def helm_calls(lint, template, client=None, server=None):
+    """Answer helm and kubectl calls by step, since lint/template and the two dry-runs run concurrently."""
+    ok = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"", stderr=b"")
+    steps = {"lint": lint, "template": template, "--dry-run=client": client or ok, "--dry-run=server": server or ok}
+    return _dispatch_by_step(steps)
+
+
+def kustomize_calls(build, client=None, server=None):
+    """Answer kubectl calls by step, since the two dry-runs run concurrently."""
+    ok = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"", stderr=b"")
+    steps = {"kustomize": build, "--dry-run=client": client or ok, "--dry-run=server": server or ok}
+    return _dispatch_by_step(steps)
+
+
+def _dispatch_by_step(steps):
+    """Build a subprocess.run fake returning (or raising) the entry for the first matching argument."""
+
+    def fake_run(cmd, **kwargs):
+        result = steps[next(arg for arg in cmd[1:] if arg in steps)]
+        if isinstance(result, BaseException):
+            raise result
+        return result
+    return fake_run
@@ -1,7 +1,10 @@
+import dataclasses
 import json
 import os
 import subprocess
 
+import pytest
+
 from kube_lint_mcp import argocd_lint
 
 # constant tests
@@ -58,7 +61,7 @@ KUBECTL_APP_LIST_JSON = json.dumps({
     "apiVersion": "argoproj.io/v1alpha1",
     "kind": "ApplicationList",
     "items": _APP_ITEMS,
-})
+}).encode()
 
 KUBECTL_APP_GET_JSON = json.dumps({
     "apiVersion": "argoproj.io/v1alpha1",
@@ -95,7 +98,7 @@ KUBECTL_APP_GET_JSON = json.dumps({
             },
         ],
     },
-})
+}).encode()
 
 KUBECTL_APP_GET_MINIMAL_JSON = json.dumps({
     "apiVersion": "argoproj.io/v1alpha1",
@@ -113,7 +116,7 @@ KUBECTL_APP_GET_MINIMAL_JSON = json.dumps({
         "sync": {"status": "Synced"},
         "health": {"status": "Healthy"},
     },
-})
+}).encode()
 
 ARGOCD_DIFF_OUTPUT = """\
 ===== apps/Deployment default/my-app ======
@@ -178,18 +181,56 @@ def test_detect_namespace_kubectl_not_found(mocker):
     assert result is None
 
 
+def test_detect_namespace_cached_per_context(mocker):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="argocd", stderr=""
+    )
+
+    assert argocd_lint._detect_argocd_namespace("my-ctx") == "argocd"
+    assert argocd_lint._detect_argocd_namespace("my-ctx") == "argocd"
+    assert mock_run.call_count == 1
+
+    argocd_lint._detect_argocd_namespace("other-ctx")
+    assert mock_run.call_count == 2
+
+
+def test_detect_namespace_failure_not_cached(mocker):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.side_effect = [
+        subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="not found"),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout="argocd", stderr=""),
+    ]
+
+    assert argocd_lint._detect_argocd_namespace("my-ctx") is None
+    assert argocd_lint._detect_argocd_namespace("my-ctx") == "argocd"
+
+
+def test_reset_namespace_cache_forces_redetection(mocker):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="argocd", stderr=""
+    )
+
+    argocd_lint._detect_argocd_namespace("my-ctx")
+    argocd_lint.reset_argocd_namespace_cache()
+    argocd_lint._detect_argocd_namespace("my-ctx")
+
+    assert mock_run.call_count == 2
+
+
 # auto-detect integration: list_argocd_apps calls detect when no namespace
 
 
 def test_list_apps_auto_detects_namespace(mocker):
     """Should auto-detect namespace then use it in kubectl -n flag."""
     mock_run = mocker.patch("subprocess.run")
-    kubectl_empty = json.dumps({"apiVersion": "argoproj.io/v1alpha1", "items": []})
+    kubectl_empty = json.dumps({"apiVersion": "argoproj.io/v1alpha1", "items": []}).encode()
     mock_run.side_effect = [
         # First call: _detect_argocd_namespace (kubectl get configmap)
         subprocess.CompletedProcess(args=[], returncode=0, stdout="argo-cd", stderr=""),
         # Second call: kubectl get applications
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=kubectl_empty, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=kubectl_empty, stderr=b""),
     ]
 
     argocd_lint.list_argocd_apps(context="my-ctx")
@@ -203,9 +244,9 @@ def test_list_apps_auto_detects_namespace(mocker):
 def test_list_apps_skips_detect_when_namespace_provided(mocker):
     """Should skip auto-detection when namespace is explicitly provided."""
     mock_run = mocker.patch("subprocess.run")
-    kubectl_empty = json.dumps({"apiVersion": "argoproj.io/v1alpha1", "items": []})
+    kubectl_empty = json.dumps({"apiVersion": "argoproj.io/v1alpha1", "items": []}).encode()
     mock_run.return_value = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout=kubectl_empty, stderr=""
+        args=[], returncode=0, stdout=kubectl_empty, stderr=b""
     )
 
     argocd_lint.list_argocd_apps(context="my-ctx", namespace="custom-ns")
@@ -316,7 +357,7 @@ def test_list_apps_success(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_APP_LIST_JSON, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_APP_LIST_JSON, stderr=b""),
     ]
 
     result = argocd_lint.list_argocd_apps(context="my-ctx")
@@ -332,13 +373,28 @@ def test_list_apps_success(mocker):
     assert result.apps[1].health_status == "Degraded"
 
 
+def test_list_apps_summaries_are_slotted_and_frozen(mocker):
+    """Should return immutable summaries without a per-instance __dict__."""
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.side_effect = [
+        _DETECT_OK,
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_APP_LIST_JSON, stderr=b""),
+    ]
+
+    app = argocd_lint.list_argocd_apps(context="my-ctx").apps[0]
+
+    assert not hasattr(app, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        app.name = "renamed"
+
+
 def test_list_apps_empty(mocker):
     """Should handle empty items list."""
     mock_run = mocker.patch("subprocess.run")
-    kubectl_empty = json.dumps({"apiVersion": "argoproj.io/v1alpha1", "items": []})
+    kubectl_empty = json.dumps({"apiVersion": "argoproj.io/v1alpha1", "items": []}).encode()
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=kubectl_empty, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=kubectl_empty, stderr=b""),
     ]
 
     result = argocd_lint.list_argocd_apps(context="my-ctx")
@@ -350,10 +406,10 @@ def test_list_apps_empty(mocker):
 def test_list_apps_uses_kubectl(mocker):
     """Should use kubectl get applications.argoproj.io."""
     mock_run = mocker.patch("subprocess.run")
-    kubectl_empty = json.dumps({"apiVersion": "argoproj.io/v1alpha1", "items": []})
+    kubectl_empty = json.dumps({"apiVersion": "argoproj.io/v1alpha1", "items": []}).encode()
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=kubectl_empty, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=kubectl_empty, stderr=b""),
     ]
 
     argocd_lint.list_argocd_apps(context="prod-cluster")
@@ -369,9 +425,9 @@ def test_list_apps_uses_kubectl(mocker):
 def test_list_apps_passes_namespace(mocker):
     """Should pass namespace via -n flag to kubectl."""
     mock_run = mocker.patch("subprocess.run")
-    kubectl_empty = json.dumps({"apiVersion": "argoproj.io/v1alpha1", "items": []})
+    kubectl_empty = json.dumps({"apiVersion": "argoproj.io/v1alpha1", "items": []}).encode()
     mock_run.return_value = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout=kubectl_empty, stderr=""
+        args=[], returncode=0, stdout=kubectl_empty, stderr=b""
     )
 
     argocd_lint.list_argocd_apps(context="my-ctx", namespace="argo-cd")
@@ -386,7 +442,7 @@ def test_list_apps_command_failure(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="error from server"),
+        subprocess.CompletedProcess(args=[], returncode=1, stdout=b"", stderr=b"error from server"),
     ]
 
     result = argocd_lint.list_argocd_apps(context="my-ctx")
@@ -395,6 +451,32 @@ def test_list_apps_command_failure(mocker):
     assert "error" in (result.error or "").lower()
 
 
+def test_list_apps_reads_raw_bytes(mocker):
+    """Should hand kubectl stdout to the JSON parser without text decoding."""
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=KUBECTL_APP_LIST_JSON, stderr=b""
+    )
+
+    result = argocd_lint.list_argocd_apps(context="my-ctx", namespace="argocd")
+
+    assert result.success is True
+    assert "text" not in mock_run.call_args.kwargs
+
+
+def test_list_apps_command_failure_undecodable_stderr(mocker):
+    """Should decode non-UTF-8 stderr with replacement characters."""
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=1, stdout=b"", stderr=b"error \xff from server"
+    )
+
+    result = argocd_lint.list_argocd_apps(context="my-ctx", namespace="argocd")
+
+    assert result.success is False
+    assert result.error == "error \ufffd from server"
+
+
 def test_list_apps_kubectl_not_found(mocker):
     """Should return error when kubectl is not on PATH."""
     mock_run = mocker.patch("subprocess.run")
@@ -428,7 +510,7 @@ def test_list_apps_json_parse_error(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="not json", stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"not json", stderr=b""),
     ]
 
     result = argocd_lint.list_argocd_apps(context="my-ctx")
@@ -445,7 +527,7 @@ def test_get_app_success(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_APP_GET_JSON, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_APP_GET_JSON, stderr=b""),
     ]
 
     result = argocd_lint.get_argocd_app("my-app", context="my-ctx")
@@ -463,7 +545,7 @@ def test_get_app_with_resources_and_conditions(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_APP_GET_JSON, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_APP_GET_JSON, stderr=b""),
     ]
 
     result = argocd_lint.get_argocd_app("my-app", context="my-ctx")
@@ -482,7 +564,7 @@ def test_get_app_minimal(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_APP_GET_MINIMAL_JSON, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_APP_GET_MINIMAL_JSON, stderr=b""),
     ]
 
     result = argocd_lint.get_argocd_app("simple-app", context="my-ctx")
@@ -498,7 +580,7 @@ def test_get_app_uses_kubectl(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_APP_GET_MINIMAL_JSON, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_APP_GET_MINIMAL_JSON, stderr=b""),
     ]
 
     argocd_lint.get_argocd_app("my-app", context="prod-cluster")
@@ -515,7 +597,7 @@ def test_get_app_passes_namespace(mocker):
     """Should pass namespace via -n flag to kubectl."""
     mock_run = mocker.patch("subprocess.run")
     mock_run.return_value = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout=KUBECTL_APP_GET_MINIMAL_JSON, stderr=""
+        args=[], returncode=0, stdout=KUBECTL_APP_GET_MINIMAL_JSON, stderr=b""
     )
 
     argocd_lint.get_argocd_app("my-app", context="my-ctx", namespace="argo-cd")
@@ -530,7 +612,7 @@ def test_get_app_command_failure(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="app 'missing' not found"),
+        subprocess.CompletedProcess(args=[], returncode=1, stdout=b"", stderr=b"app 'missing' not found"),
     ]
 
     result = argocd_lint.get_argocd_app("missing", context="my-ctx")
@@ -572,7 +654,7 @@ def test_get_app_json_parse_error(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="not json", stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"not json", stderr=b""),
     ]
 
     result = argocd_lint.get_argocd_app("my-app", context="my-ctx")
@@ -586,7 +668,7 @@ def test_get_app_unexpected_format(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout='"just a string"', stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b'"just a string"', stderr=b""),
     ]
 
     result = argocd_lint.get_argocd_app("my-app", context="my-ctx")
@@ -639,6 +721,36 @@ def test_diff_app_has_diff(mocker, tmp_path):
     assert "replicas" in result.diff_output
 
 
+def test_diff_app_truncates_large_diff(mocker, tmp_path):
+    """Should cap diff output at ARGOCD_DIFF_LIMIT characters."""
+    mocker.patch.object(argocd_lint, "ARGOCD_DIFF_LIMIT", 10)
+    mock_run = _mock_diff_setup(mocker, tmp_path)
+    mock_run.side_effect = [
+        _DETECT_OK,
+        _SET_CTX_OK,
+        subprocess.CompletedProcess(args=[], returncode=1, stdout="x" * 25, stderr=""),
+    ]
+
+    result = argocd_lint.diff_argocd_app("my-app", context="my-ctx")
+
+    assert result.diff_output == "x" * 10 + "\n[truncated 15 characters]"
+
+
+def test_diff_app_no_truncation_when_limit_disabled(mocker, tmp_path):
+    """Should return the full diff when ARGOCD_DIFF_LIMIT is 0."""
+    mocker.patch.object(argocd_lint, "ARGOCD_DIFF_LIMIT", 0)
+    mock_run = _mock_diff_setup(mocker, tmp_path)
+    mock_run.side_effect = [
+        _DETECT_OK,
+        _SET_CTX_OK,
+        subprocess.CompletedProcess(args=[], returncode=1, stdout="x" * 25, stderr=""),
+    ]
+
+    result = argocd_lint.diff_argocd_app("my-app", context="my-ctx")
+
+    assert result.diff_output == "x" * 25
+
+
 def test_diff_app_error(mocker, tmp_path):
     """Should return error when argocd diff exits 2."""
     mock_run = _mock_diff_setup(mocker, tmp_path)
@@ -771,6 +883,13 @@ def test_extract_source_non_dict_source():
     assert rev == ""
 
 
+def test_extract_source_non_dict_first_source():
+    url, path, rev = argocd_lint._extract_source({"sources": ["not a dict"]})
+    assert url == ""
+    assert path == ""
+    assert rev == ""
+
+
 # Edge case: non-dict items in kubectl response
 
 
@@ -779,7 +898,7 @@ def test_list_apps_no_items_key(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout='{"not": "items"}', stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b'{"not": "items"}', stderr=b""),
     ]
 
     result = argocd_lint.list_argocd_apps(context="my-ctx")
@@ -791,10 +910,10 @@ def test_list_apps_no_items_key(mocker):
 def test_list_apps_non_dict_items(mocker):
     """Should skip non-dict items in the items array."""
     mock_run = mocker.patch("subprocess.run")
-    data = json.dumps({"items": ["not a dict", 42]})
+    data = json.dumps({"items": ["not a dict", 42]}).encode()
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=data, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=data, stderr=b""),
     ]
 
     result = argocd_lint.list_argocd_apps(context="my-ctx")
@@ -826,7 +945,7 @@ def test_get_app_with_non_dict_resource(mocker):
     }
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=json.dumps(data), stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=json.dumps(data).encode(), stderr=b""),
     ]
 
     result = argocd_lint.get_argocd_app("app", context="my-ctx")
@@ -842,10 +961,10 @@ def test_get_app_with_non_dict_resource(mocker):
 def test_list_apps_items_not_a_list(mocker):
     """Should handle items being a non-list value (e.g. string)."""
     mock_run = mocker.patch("subprocess.run")
-    data = json.dumps({"items": "not a list"})
+    data = json.dumps({"items": "not a list"}).encode()
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=data, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=data, stderr=b""),
     ]
 
     result = argocd_lint.list_argocd_apps(context="my-ctx")
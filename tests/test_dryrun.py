@@ -1,8 +1,11 @@
+import logging
 import subprocess
+import threading
 
 from kube_lint_mcp.dryrun import (
     KUBECTL_TIMEOUT,
     build_ctx_args,
+    count_documents,
     kubectl_dry_run,
     parse_warnings,
 )
@@ -23,9 +26,9 @@ def test_build_ctx_args_without_context():
 
 def test_parse_warnings_finds_deprecation_warnings():
     output = (
-        "configmap/test configured\n"
-        "Warning: policy/v1beta1 PodSecurityPolicy is deprecated\n"
-        "Warning: batch/v1beta1 CronJob is deprecated\n"
+        b"configmap/test configured\n"
+        b"Warning: policy/v1beta1 PodSecurityPolicy is deprecated\n"
+        b"Warning: batch/v1beta1 CronJob is deprecated\n"
     )
     result = parse_warnings(output)
 
@@ -36,8 +39,8 @@ def test_parse_warnings_finds_deprecation_warnings():
 
 def test_parse_warnings_catches_non_deprecation_warnings():
     output = (
-        "configmap/test configured\n"
-        "Warning: unknown field spec.foo\n"
+        b"configmap/test configured\n"
+        b"Warning: unknown field spec.foo\n"
     )
     result = parse_warnings(output)
 
@@ -46,12 +49,62 @@ def test_parse_warnings_catches_non_deprecation_warnings():
 
 
 def test_parse_warnings_empty():
-    output = "configmap/test configured\nservice/test configured\n"
+    output = b"configmap/test configured\nservice/test configured\n"
     result = parse_warnings(output)
 
     assert result == []
 
 
+def test_parse_warnings_strips_whitespace_and_matches_case_insensitively():
+    output = (
+        b"  WARNING: something odd\r\n"
+        b"\tapps/v1beta1 Deployment is DEPRECATED  \n"
+        b"warnings are not a prefix match\n"
+        b"\n"
+    )
+    result = parse_warnings(output)
+
+    assert result == ["WARNING: something odd", "apps/v1beta1 Deployment is DEPRECATED"]
+
+
+# count_documents tests
+
+
+def test_count_documents_ignores_comment_only_and_empty_documents():
+    rendered = (
+        b"---\n# Source: chart/templates/empty.yaml\n"
+        b"---\n# Source: chart/templates/cm.yaml\napiVersion: v1\nkind: ConfigMap\n"
+        b"---   \n\n"
+        b"---\n# Source: chart/templates/svc.yaml\napiVersion: v1\nkind: Service\n"
+    )
+
+    assert count_documents(rendered) == 2
+
+
+def test_count_documents_without_leading_separator():
+    assert count_documents(b"apiVersion: v1\nkind: ConfigMap\n") == 1
+
+
+def test_count_documents_ignores_separator_inside_block_scalar_text():
+    rendered = b"apiVersion: v1\nkind: ConfigMap\ndata:\n  script: |\n    echo ---done\n"
+
+    assert count_documents(rendered) == 1
+
+
+def test_count_documents_crlf_separators():
+    assert count_documents(b"# c\r\n---\r\n# d\r\n") == 0
+    assert count_documents(b"apiVersion: v1\r\n---\r\nkind: ConfigMap\r\n") == 2
+
+
+def test_count_documents_separator_with_trailing_comment():
+    assert count_documents(b"--- # x\n# only\n") == 0
+    assert count_documents(b"--- # first\nkind: A\n--- #second\nkind: B\n") == 2
+
+
+def test_count_documents_empty_output():
+    assert count_documents(b"") == 0
+
+
 # kubectl_dry_run tests
 
 
@@ -59,10 +112,10 @@ def test_kubectl_dry_run_both_pass(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
     ]
 
@@ -79,7 +132,7 @@ def test_kubectl_dry_run_client_fail(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="error: invalid resource"
+            args=[], returncode=1, stdout=b"", stderr=b"error: invalid resource"
         ),
     ]
 
@@ -94,10 +147,10 @@ def test_kubectl_dry_run_server_fail(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="error: forbidden"
+            args=[], returncode=1, stdout=b"", stderr=b"error: forbidden"
         ),
     ]
 
@@ -112,13 +165,13 @@ def test_kubectl_dry_run_with_deprecation_warnings(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         subprocess.CompletedProcess(
             args=[],
             returncode=0,
-            stdout="configured\n",
-            stderr="Warning: policy/v1beta1 PodSecurityPolicy is deprecated",
+            stdout=b"configured\n",
+            stderr=b"Warning: policy/v1beta1 PodSecurityPolicy is deprecated",
         ),
     ]
 
@@ -153,14 +206,30 @@ def test_kubectl_dry_run_kubectl_not_found(mocker):
     assert "kubectl not found" in result.client_error
 
 
+def test_kubectl_dry_run_collects_warnings_from_stdout_then_stderr(mocker):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.side_effect = [
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+        subprocess.CompletedProcess(
+            args=[], returncode=0,
+            stdout=b"Warning: apps/v1beta1 is deprecated\n",
+            stderr=b"Warning: unknown field spec.foo\n",
+        ),
+    ]
+
+    result = kubectl_dry_run("/tmp/test.yaml")
+
+    assert result.warnings == ["Warning: apps/v1beta1 is deprecated", "Warning: unknown field spec.foo"]
+
+
 def test_kubectl_dry_run_passes_context(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
     ]
 
@@ -177,10 +246,10 @@ def test_kubectl_dry_run_no_context(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
     ]
 
@@ -195,10 +264,10 @@ def test_kubectl_dry_run_stdin_data(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.side_effect = [
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
     ]
 
@@ -212,7 +281,150 @@ def test_kubectl_dry_run_stdin_data(mocker):
         cmd = call[0][0]
         assert "-f" in cmd
         assert "-" in cmd
-        assert call[1]["input"] == yaml_data
+        assert call[1]["input"] == yaml_data.encode()
+
+
+def test_kubectl_dry_run_fast_runs_only_server_on_success(mocker):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"configured\n", stderr=b""
+    )
+
+    result = kubectl_dry_run("/tmp/test.yaml", fast=True)
+
+    assert mock_run.call_count == 1
+    assert "--dry-run=server" in mock_run.call_args[0][0]
+    assert result.client_passed is True
+    assert result.server_passed is True
+
+
+def test_kubectl_dry_run_fast_attributes_client_error(mocker):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.side_effect = [
+        subprocess.CompletedProcess(args=[], returncode=1, stdout=b"", stderr=b"error: parse"),
+        subprocess.CompletedProcess(args=[], returncode=1, stdout=b"", stderr=b"error: invalid resource"),
+    ]
+
+    result = kubectl_dry_run("/tmp/test.yaml", fast=True)
+
+    assert "--dry-run=client" in mock_run.call_args_list[1][0][0]
+    assert result.client_passed is False
+    assert result.server_passed is False
+    assert result.client_error == "error: invalid resource"
+
+
+def test_kubectl_dry_run_fast_attributes_server_error(mocker):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.side_effect = [
+        subprocess.CompletedProcess(args=[], returncode=1, stdout=b"", stderr=b"error: forbidden"),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"configured\n", stderr=b""),
+    ]
+
+    result = kubectl_dry_run("/tmp/test.yaml", fast=True)
+
+    assert result.client_passed is True
+    assert result.server_passed is False
+    assert result.server_error == "error: forbidden"
+
+
+def test_kubectl_dry_run_decodes_invalid_utf8_in_errors(mocker):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=1, stdout=b"", stderr=b"error: bad \xff byte\n"
+    )
+
+    result = kubectl_dry_run("/tmp/test.yaml")
+
+    assert result.client_passed is False
+    assert result.client_error == "error: bad \ufffd byte"
+
+
+def test_kubectl_dry_run_logs_command_at_debug(mocker, caplog):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b"")
+
+    with caplog.at_level(logging.DEBUG, logger="kube_lint_mcp.dryrun"):
+        kubectl_dry_run("/tmp/test.yaml", context="my-ctx")
+
+    assert "kubectl --context my-ctx apply --dry-run=client -f /tmp/test.yaml" in caplog.text
+
+
+def test_kubectl_dry_run_does_not_sweep_fds(mocker):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b"")
+
+    kubectl_dry_run("/tmp/test.yaml")
+
+    assert all(call.kwargs["close_fds"] is False for call in mock_run.call_args_list)
+
+
+def test_kubectl_dry_run_server_disabled_runs_client_only(mocker):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="configured\n", stderr=""
+    )
+
+    result = kubectl_dry_run("/tmp/test.yaml", server=False)
+
+    assert mock_run.call_count == 1
+    assert "--dry-run=client" in mock_run.call_args[0][0]
+    assert result.client_passed is True
+    assert result.server_skipped is True
+
+
+def test_kubectl_dry_run_parallel_starts_client_and_server_together(mocker):
+    # Each dry-run blocks until the other has started; run serially this would time out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_run(cmd, **kwargs):
+        barrier.wait()
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=b"configured\n", stderr=b"")
+
+    mock_run = mocker.patch("subprocess.run", side_effect=fake_run)
+
+    result = kubectl_dry_run(stdin_data=b"kind: ConfigMap\n", parallel=True)
+
+    assert mock_run.call_count == 2
+    assert result.client_passed is True
+    assert result.server_passed is True
+
+
+def test_kubectl_dry_run_parallel_reports_client_failure(mocker):
+    def fake_run(cmd, **kwargs):
+        if "--dry-run=client" in cmd:
+            return subprocess.CompletedProcess(args=cmd, returncode=1, stdout=b"", stderr=b"error: parse")
+        return subprocess.CompletedProcess(args=cmd, returncode=1, stdout=b"", stderr=b"error: parse too")
+
+    mocker.patch("subprocess.run", side_effect=fake_run)
+
+    result = kubectl_dry_run(stdin_data=b"{{{", parallel=True)
+
+    assert result.client_passed is False
+    assert result.server_passed is False
+    assert result.client_error == "error: parse"
+    assert result.server_error is None
+
+
+def test_kubectl_dry_run_parallel_client_failure_does_not_wait_for_server(mocker):
+    release = threading.Event()
+
+    def fake_run(cmd, **kwargs):
+        if "--dry-run=client" in cmd:
+            return subprocess.CompletedProcess(args=cmd, returncode=1, stdout=b"", stderr=b"error: parse")
+        # Stands in for an unreachable API server
+        release.wait(timeout=5)
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=b"", stderr=b"")
+
+    mocker.patch("subprocess.run", side_effect=fake_run)
+
+    try:
+        result = kubectl_dry_run(stdin_data=b"{{{", parallel=True)
+        server_still_running = not release.is_set()
+    finally:
+        release.set()
+
+    assert server_still_running
+    assert result.client_error == "error: parse"
 
 
 def test_kubectl_timeout_constant():
@@ -1,3 +1,4 @@
+import os
 import subprocess
 
 from kube_lint_mcp import flux_lint
@@ -9,6 +10,14 @@ def test_flux_timeout_default_value():
     """Should default to 60 seconds."""
     assert flux_lint.FLUX_TIMEOUT == 60
 
+
+def test_yaml_suffixes_constant():
+    assert flux_lint.YAML_SUFFIXES == (".yaml", ".yml")
+
+
+def test_batch_dryrun_enabled_by_default():
+    assert flux_lint.BATCH_DRYRUN is True
+
 # find_yaml_files tests
 
 
@@ -60,6 +69,15 @@ def test_find_yaml_files_returns_sorted(tmp_path):
     assert result == sorted(result)
 
 
+def test_find_yaml_files_skips_directories_with_yaml_suffix(tmp_path):
+    (tmp_path / "charts.yaml").mkdir()
+    (tmp_path / "charts.yaml" / "real.yaml").write_text("a")
+
+    result = flux_lint.find_yaml_files(str(tmp_path))
+
+    assert result == [str(tmp_path / "charts.yaml" / "real.yaml")]
+
+
 def test_find_yaml_files_nonexistent_path():
     result = flux_lint.find_yaml_files("/nonexistent/path")
 
@@ -69,14 +87,18 @@ def test_find_yaml_files_nonexistent_path():
 # get_kubectl_contexts tests
 
 
+def _kubectl_config(contexts, current, current_returncode=0):
+    """Answer kubectl config calls by subcommand, since both run concurrently."""
+    def fake_run(cmd, **kwargs):
+        if "current-context" in cmd:
+            return subprocess.CompletedProcess(args=cmd, returncode=current_returncode, stdout=current, stderr="")
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=contexts, stderr="")
+    return fake_run
+
+
 def test_get_kubectl_contexts_returns_contexts_and_current(mocker):
     mock_run = mocker.patch("subprocess.run")
-    mock_run.side_effect = [
-        subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="ctx-a\nctx-b\n", stderr=""
-        ),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ctx-a\n", stderr=""),
-    ]
+    mock_run.side_effect = _kubectl_config("ctx-a\nctx-b\n", "ctx-a\n")
 
     contexts, current = flux_lint.get_kubectl_contexts()
 
@@ -86,10 +108,7 @@ def test_get_kubectl_contexts_returns_contexts_and_current(mocker):
 
 def test_get_kubectl_contexts_no_current(mocker):
     mock_run = mocker.patch("subprocess.run")
-    mock_run.side_effect = [
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ctx-a\n", stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="error"),
-    ]
+    mock_run.side_effect = _kubectl_config("ctx-a\n", "", current_returncode=1)
 
     contexts, current = flux_lint.get_kubectl_contexts()
 
@@ -97,6 +116,16 @@ def test_get_kubectl_contexts_no_current(mocker):
     assert current is None
 
 
+def test_get_kubectl_contexts_runs_both_lookups(mocker):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.side_effect = _kubectl_config("ctx-a\n", "ctx-a\n")
+
+    flux_lint.get_kubectl_contexts()
+
+    commands = sorted(call.args[0][1:] for call in mock_run.call_args_list)
+    assert commands == [["config", "current-context"], ["config", "get-contexts", "-o", "name"]]
+
+
 def test_get_kubectl_contexts_timeout(mocker):
     mocker.patch(
         "subprocess.run", side_effect=subprocess.TimeoutExpired(cmd="kubectl", timeout=10)
@@ -117,6 +146,58 @@ def test_get_kubectl_contexts_kubectl_not_found(mocker):
     assert current is None
 
 
+def test_get_kubectl_contexts_cached_within_ttl(mocker):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.side_effect = [
+        subprocess.CompletedProcess(args=[], returncode=0, stdout="ctx-a\n", stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout="ctx-a\n", stderr=""),
+    ]
+
+    first = flux_lint.get_kubectl_contexts()
+    second = flux_lint.get_kubectl_contexts()
+
+    assert first == second == (["ctx-a"], "ctx-a")
+    assert mock_run.call_count == 2
+
+
+def test_get_kubectl_contexts_refreshes_after_ttl(mocker):
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="ctx-a\n", stderr=""
+    )
+    mock_time = mocker.patch("kube_lint_mcp.flux_lint.time.monotonic", return_value=100.0)
+
+    flux_lint.get_kubectl_contexts()
+    mock_time.return_value = 100.0 + flux_lint.CONTEXTS_CACHE_TTL
+    flux_lint.get_kubectl_contexts()
+
+    assert mock_run.call_count == 4
+
+
+def test_get_kubectl_contexts_refreshes_when_kubeconfig_changes(mocker, monkeypatch, tmp_path):
+    kubeconfig = tmp_path / "config"
+    kubeconfig.write_text("a")
+    monkeypatch.setenv("KUBECONFIG", str(kubeconfig))
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.side_effect = _kubectl_config("ctx-a\n", "ctx-a\n")
+
+    flux_lint.get_kubectl_contexts()
+    os.utime(kubeconfig, ns=(0, 0))
+    flux_lint.get_kubectl_contexts()
+
+    assert mock_run.call_count == 4
+
+
+def test_get_kubectl_contexts_failure_not_cached(mocker):
+    mock_run = mocker.patch("subprocess.run", side_effect=FileNotFoundError)
+
+    flux_lint.get_kubectl_contexts()
+    flux_lint.get_kubectl_contexts()
+
+    # Each attempt forks both lookups; nothing is cached in between
+    assert mock_run.call_count == 4
+
+
 # context_exists tests
 
 
@@ -155,10 +236,10 @@ def test_validate_manifest_both_pass(mocker, tmp_path):
     f.write_text("apiVersion: v1\nkind: ConfigMap")
     mock_run.side_effect = [
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
     ]
 
@@ -174,8 +255,8 @@ def test_validate_manifest_passes_context_flag(mocker, tmp_path):
     f = tmp_path / "test.yaml"
     f.write_text("apiVersion: v1")
     mock_run.side_effect = [
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
     ]
 
     flux_lint.validate_manifest(str(f), context="prod-cluster")
@@ -190,8 +271,8 @@ def test_validate_manifest_no_context_flag_when_none(mocker, tmp_path):
     f = tmp_path / "test.yaml"
     f.write_text("apiVersion: v1")
     mock_run.side_effect = [
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
     ]
 
     flux_lint.validate_manifest(str(f), context=None)
@@ -205,7 +286,7 @@ def test_validate_manifest_client_fail(mocker, tmp_path):
     f = tmp_path / "bad.yaml"
     f.write_text("invalid")
     mock_run.return_value = subprocess.CompletedProcess(
-        args=[], returncode=1, stdout="", stderr="error: invalid manifest"
+        args=[], returncode=1, stdout=b"", stderr=b"error: invalid manifest"
     )
 
     result = flux_lint.validate_manifest(str(f))
@@ -220,10 +301,12 @@ def test_validate_manifest_server_fail(mocker, tmp_path):
     f = tmp_path / "srvfail.yaml"
     f.write_text("apiVersion: v1")
     mock_run.side_effect = [
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
+        # server dry-run runs first
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="server rejected"
+            args=[], returncode=1, stdout=b"", stderr=b"server rejected"
         ),
+        # client dry-run only runs to attribute the failure
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
     ]
 
     result = flux_lint.validate_manifest(str(f))
@@ -238,12 +321,11 @@ def test_validate_manifest_captures_deprecation_warnings(mocker, tmp_path):
     f = tmp_path / "dep.yaml"
     f.write_text("apiVersion: v1")
     mock_run.side_effect = [
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
         subprocess.CompletedProcess(
             args=[],
             returncode=0,
-            stdout="",
-            stderr="Warning: v1beta1 is deprecated, use v1",
+            stdout=b"",
+            stderr=b"Warning: v1beta1 is deprecated, use v1",
         ),
     ]
 
@@ -279,6 +361,58 @@ def test_validate_manifest_kubectl_not_found(mocker, tmp_path):
     assert "kubectl not found" in result.client_error
 
 
+def test_is_client_only_true_for_builtin_kinds(tmp_path):
+    f = tmp_path / "cm.yaml"
+    f.write_text("apiVersion: v1\nkind: ConfigMap\n---\napiVersion: apps/v1\nkind: Deployment\n")
+
+    assert flux_lint.is_client_only(str(f)) is True
+
+
+def test_is_client_only_false_for_custom_resources(tmp_path):
+    f = tmp_path / "ks.yaml"
+    f.write_text(
+        "apiVersion: v1\nkind: ConfigMap\n---\n"
+        "apiVersion: kustomize.toolkit.fluxcd.io/v1\nkind: Kustomization\n"
+    )
+
+    assert flux_lint.is_client_only(str(f)) is False
+
+
+def test_is_client_only_false_for_invalid_or_empty_yaml(tmp_path):
+    bad = tmp_path / "bad.yaml"
+    bad.write_text("key: [unclosed")
+    empty = tmp_path / "empty.yaml"
+    empty.write_text("")
+
+    assert flux_lint.is_client_only(str(bad)) is False
+    assert flux_lint.is_client_only(str(empty)) is False
+
+
+def test_validate_manifest_non_strict_skips_server_for_builtin_kinds(mocker, tmp_path):
+    mock_run = mocker.patch("subprocess.run")
+    f = tmp_path / "cm.yaml"
+    f.write_text("apiVersion: v1\nkind: ConfigMap\n")
+    mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
+
+    result = flux_lint.validate_manifest(str(f), strict=False)
+
+    assert mock_run.call_count == 1
+    assert result.server_skipped is True
+
+
+def test_validate_manifest_strict_by_default(mocker, tmp_path):
+    mock_run = mocker.patch("subprocess.run")
+    f = tmp_path / "cm.yaml"
+    f.write_text("apiVersion: v1\nkind: ConfigMap\n")
+    mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b"")
+
+    result = flux_lint.validate_manifest(str(f))
+
+    assert mock_run.call_count == 1
+    assert "--dry-run=server" in mock_run.call_args.args[0]
+    assert result.server_skipped is False
+
+
 # validate_manifests tests
 
 
@@ -287,7 +421,7 @@ def test_validate_manifests_validates_all_files(mocker, tmp_path):
     (tmp_path / "a.yaml").write_text("a")
     (tmp_path / "b.yaml").write_text("b")
     mock_run.return_value = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout="ok", stderr=""
+        args=[], returncode=0, stdout=b"ok", stderr=b""
     )
 
     results = flux_lint.validate_manifests(str(tmp_path))
@@ -295,6 +429,81 @@ def test_validate_manifests_validates_all_files(mocker, tmp_path):
     assert len(results) == 2
 
 
+def test_validate_manifests_preserves_file_order(mocker, tmp_path):
+    names = [f"{c}.yaml" for c in "edcba"]
+    for name in names:
+        (tmp_path / name).write_text("apiVersion: v1")
+    mocker.patch("subprocess.run", return_value=subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"ok", stderr=b""
+    ))
+
+    results = flux_lint.validate_manifests(str(tmp_path))
+
+    assert [r.file for r in results] == sorted(str(tmp_path / n) for n in names)
+
+
+def test_validate_manifests_respects_parallelism(mocker, tmp_path):
+    for name in ("a.yaml", "b.yaml", "c.yaml"):
+        (tmp_path / name).write_text(f"apiVersion: v1\nkind: {name}")
+    mocker.patch.object(flux_lint, "PARALLELISM", 2)
+    mock_executor = mocker.patch.object(flux_lint, "ThreadPoolExecutor", wraps=flux_lint.ThreadPoolExecutor)
+    mocker.patch("subprocess.run", return_value=subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"ok", stderr=b""
+    ))
+
+    flux_lint.validate_manifests(str(tmp_path))
+
+    mock_executor.assert_called_once_with(max_workers=2)
+
+
+def test_validate_manifests_serial_when_parallelism_is_one(mocker, tmp_path):
+    for name in ("a.yaml", "b.yaml"):
+        (tmp_path / name).write_text("apiVersion: v1")
+    mocker.patch.object(flux_lint, "PARALLELISM", 1)
+    mock_executor = mocker.patch.object(flux_lint, "ThreadPoolExecutor", wraps=flux_lint.ThreadPoolExecutor)
+    mocker.patch("subprocess.run", return_value=subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"ok", stderr=b""
+    ))
+
+    flux_lint.validate_manifests(str(tmp_path))
+
+    mock_executor.assert_called_once_with(max_workers=1)
+
+
+def test_validate_manifests_dry_runs_identical_files_once(mocker, tmp_path):
+    for env in ("dev", "prod"):
+        (tmp_path / f"{env}.yaml").write_text("apiVersion: v1\nkind: Service")
+    (tmp_path / "other.yaml").write_text("apiVersion: v1\nkind: ConfigMap")
+    mock_run = mocker.patch("subprocess.run", return_value=subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"ok", stderr=b""
+    ))
+
+    results = flux_lint.validate_manifests(str(tmp_path))
+
+    assert mock_run.call_count == 2
+    assert [r.file for r in results] == [str(tmp_path / n) for n in ("dev.yaml", "other.yaml", "prod.yaml")]
+    assert all(r.server_passed for r in results)
+
+
+def test_validate_manifests_shares_failure_with_duplicates(mocker, tmp_path):
+    for env in ("dev", "prod"):
+        (tmp_path / f"{env}.yaml").write_text("apiVersion: v1\nkind: Service")
+    dev_path, prod_path = str(tmp_path / "dev.yaml"), str(tmp_path / "prod.yaml")
+    stderr = f'Error from server (Forbidden): error when creating "{dev_path}": services is forbidden'
+    mocker.patch("subprocess.run", side_effect=[
+        subprocess.CompletedProcess(args=[], returncode=1, stdout=b"", stderr=stderr.encode()),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+    ])
+
+    dev, prod = flux_lint.validate_manifests(str(tmp_path))
+
+    assert dev.file == dev_path
+    assert prod.file == prod_path
+    assert dev.server_error == stderr
+    assert prod.server_error == stderr.replace(dev_path, prod_path)
+    assert dev_path not in prod.server_error
+
+
 def test_validate_manifests_empty_for_no_yaml(tmp_path):
     (tmp_path / "readme.md").write_text("hello")
 
@@ -303,6 +512,168 @@ def test_validate_manifests_empty_for_no_yaml(tmp_path):
     assert results == []
 
 
+# validate_manifests_iter tests
+
+
+def test_validate_manifests_iter_yields_every_file(mocker, tmp_path):
+    for name in ("a.yaml", "b.yaml", "c.yaml"):
+        (tmp_path / name).write_text("apiVersion: v1")
+    mocker.patch("subprocess.run", return_value=subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"ok", stderr=b""
+    ))
+
+    results = list(flux_lint.validate_manifests_iter(str(tmp_path)))
+
+    assert sorted(r.file for r in results) == [str(tmp_path / n) for n in ("a.yaml", "b.yaml", "c.yaml")]
+    assert all(r.client_passed and r.server_passed for r in results)
+
+
+def test_validate_manifests_iter_is_lazy(mocker, tmp_path):
+    (tmp_path / "a.yaml").write_text("apiVersion: v1")
+    mock_run = mocker.patch("subprocess.run")
+
+    results = flux_lint.validate_manifests_iter(str(tmp_path))
+
+    mock_run.assert_not_called()
+    results.close()
+
+
+def test_validate_manifests_iter_empty_for_no_yaml(tmp_path):
+    assert list(flux_lint.validate_manifests_iter(str(tmp_path))) == []
+
+
+# validate_manifests_batched tests
+
+
+def test_validate_manifests_batched_single_server_dry_run_on_success(mocker, tmp_path):
+    (tmp_path / "a.yaml").write_text("kind: A")
+    (tmp_path / "b.yaml").write_text("kind: B\n")
+    mock_run = mocker.patch("subprocess.run", return_value=subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"ok", stderr=b""
+    ))
+
+    results = flux_lint.validate_manifests_batched(str(tmp_path))
+
+    assert mock_run.call_count == 1
+    assert "--dry-run=server" in mock_run.call_args.args[0]
+    assert mock_run.call_args.kwargs["input"] == b"kind: A\n---\nkind: B\n"
+    assert [r.file for r in results] == [str(tmp_path / "a.yaml"), str(tmp_path / "b.yaml")]
+    assert all(r.client_passed and r.server_passed for r in results)
+
+
+def test_validate_manifests_batched_validates_empty_file_separately(mocker, tmp_path):
+    (tmp_path / "a.yaml").write_text("kind: A\n")
+    (tmp_path / "b.yaml").write_text("kind: B\n")
+    (tmp_path / "c.yaml").write_text("# nothing here\n---\n")
+    empty = str(tmp_path / "c.yaml")
+
+    def fake_run(cmd, **kwargs):
+        if cmd[-1] == empty:
+            return subprocess.CompletedProcess(
+                args=cmd, returncode=1, stdout=b"", stderr=b"error: no objects passed to apply"
+            )
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=b"ok", stderr=b"")
+
+    mock_run = mocker.patch("subprocess.run", side_effect=fake_run)
+
+    results = flux_lint.validate_manifests_batched(str(tmp_path))
+
+    assert mock_run.call_args_list[0].kwargs["input"] == b"kind: A\n---\nkind: B\n"
+    assert [r.file for r in results] == [str(tmp_path / n) for n in ("a.yaml", "b.yaml", "c.yaml")]
+    assert [r.server_passed for r in results] == [True, True, False]
+    assert results[2].client_error == "error: no objects passed to apply"
+
+
+def test_validate_manifests_batched_validates_crlf_comment_only_file_separately(mocker, tmp_path):
+    (tmp_path / "a.yaml").write_text("kind: A\n")
+    (tmp_path / "b.yaml").write_text("kind: B\n")
+    (tmp_path / "c.yaml").write_bytes(b"# c\r\n---\r\n# d\r\n")
+    mock_run = mocker.patch("subprocess.run", return_value=subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"ok", stderr=b""
+    ))
+
+    flux_lint.validate_manifests_batched(str(tmp_path))
+
+    assert mock_run.call_args_list[0].kwargs["input"] == b"kind: A\n---\nkind: B\n"
+    assert mock_run.call_args_list[1].args[0][-1] == str(tmp_path / "c.yaml")
+
+
+def test_validate_manifests_batched_non_strict_keeps_client_only_files_out(mocker, tmp_path):
+    (tmp_path / "a.yaml").write_text("apiVersion: example.com/v1\nkind: A\n")
+    (tmp_path / "b.yaml").write_text("apiVersion: example.com/v1\nkind: B\n")
+    (tmp_path / "c.yaml").write_text("apiVersion: v1\nkind: ConfigMap\n")
+    mock_run = mocker.patch("subprocess.run", return_value=subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"ok", stderr=b""
+    ))
+
+    results = flux_lint.validate_manifests_batched(str(tmp_path), strict=False)
+
+    batch_call, c_call = mock_run.call_args_list
+    assert b"ConfigMap" not in batch_call.kwargs["input"]
+    assert "--dry-run=client" in c_call.args[0]
+    assert [r.server_skipped for r in results] == [False, False, True]
+
+
+def test_validate_manifests_batched_falls_back_per_file_on_failure(mocker, tmp_path):
+    (tmp_path / "a.yaml").write_text("kind: A")
+    (tmp_path / "b.yaml").write_text("kind: B")
+    mocker.patch("subprocess.run", return_value=subprocess.CompletedProcess(
+        args=[], returncode=1, stdout=b"", stderr=b"error: bad"
+    ))
+    mock_validate = mocker.patch.object(
+        flux_lint,
+        "validate_manifest",
+        side_effect=lambda f, context=None, strict=True: flux_lint.ValidationResult(
+            file=f, client_passed=False, server_passed=False, client_error="bad"
+        ),
+    )
+
+    results = flux_lint.validate_manifests_batched(str(tmp_path), context="ctx")
+
+    assert mock_validate.call_count == 2
+    assert [r.client_error for r in results] == ["bad", "bad"]
+
+
+def test_validate_manifests_batched_falls_back_per_file_on_warnings(mocker, tmp_path):
+    (tmp_path / "a.yaml").write_text("kind: A")
+    (tmp_path / "b.yaml").write_text("kind: B")
+    mock_run = mocker.patch("subprocess.run", return_value=subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"", stderr=b"Warning: v1beta1 is deprecated"
+    ))
+    mock_validate = mocker.patch.object(flux_lint, "validate_manifest")
+
+    flux_lint.validate_manifests_batched(str(tmp_path))
+
+    assert mock_run.call_count == 1
+    assert mock_validate.call_count == 2
+
+
+def test_validate_manifests_batched_kubectl_missing_fails_fast(mocker, tmp_path):
+    (tmp_path / "a.yaml").write_text("kind: A")
+    (tmp_path / "b.yaml").write_text("kind: B")
+    mock_run = mocker.patch("subprocess.run", side_effect=FileNotFoundError)
+
+    results = flux_lint.validate_manifests_batched(str(tmp_path))
+
+    assert mock_run.call_count == 1
+    assert [r.client_error for r in results] == ["kubectl not found", "kubectl not found"]
+
+
+def test_validate_manifests_batched_single_file_skips_batch(mocker, tmp_path):
+    (tmp_path / "a.yaml").write_text("kind: A")
+    mock_run = mocker.patch("subprocess.run")
+    mock_validate = mocker.patch.object(flux_lint, "validate_manifest")
+
+    flux_lint.validate_manifests_batched(str(tmp_path))
+
+    mock_run.assert_not_called()
+    mock_validate.assert_called_once_with(str(tmp_path / "a.yaml"), context=None, strict=True)
+
+
+def test_validate_manifests_batched_empty_for_no_yaml(tmp_path):
+    assert flux_lint.validate_manifests_batched(str(tmp_path)) == []
+
+
 # run_flux_check tests
 
 
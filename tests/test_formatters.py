@@ -37,6 +37,14 @@ def test_format_step_fail_with_error():
     assert result == expected
 
 
+def test_format_step_indent_prefixes_every_line():
+    """Should prefix the status line and its detail lines with indent."""
+    result = formatters.format_step("Client dry-run", False, error="invalid resource", indent="  ")
+
+    expected = ["  Client dry-run: FAIL", "    Error: invalid resource"]
+    assert result == expected
+
+
 # format_summary tests
 
 
@@ -128,6 +136,20 @@ def test_format_flux_results_server_pass_with_warnings():
     assert "1 passed, 0 failed" in output
 
 
+def test_format_flux_results_server_skipped():
+    """Should report a skipped server dry-run as passing."""
+    results = [
+        flux_lint.ValidationResult(
+            file="cm.yaml", client_passed=True, server_passed=True, server_skipped=True,
+        ),
+    ]
+
+    output = formatters.format_flux_results(results, "ctx", "/tmp")
+
+    assert "Server dry-run: SKIPPED" in output
+    assert "1 passed, 0 failed" in output
+
+
 def test_format_flux_results_mixed():
     """Should correctly count mixed pass/fail results."""
     results = [
@@ -212,6 +234,7 @@ def test_format_helm_result_all_pass():
     assert "Helm template: PASS (3 resources)" in output
     assert "Client dry-run: PASS" in output
     assert "Server dry-run: PASS" in output
+    assert "Summary: 4 passed, 0 failed" in output
     assert "Safe to commit" in output
 
 
@@ -257,6 +280,7 @@ def test_format_helm_result_render_fail():
 
     assert "Helm template: FAIL" in output
     assert "template rendering failed" in output
+    assert "Summary: 1 passed, 3 failed" in output
     assert "DO NOT COMMIT" in output
 
 
@@ -1,6 +1,8 @@
 import subprocess
+import threading
 
 from kube_lint_mcp import helm_lint
+from tests.helpers import helm_calls
 
 # constant tests
 
@@ -38,6 +40,12 @@ def test_is_helm_chart_false_for_non_chart(tmp_path):
     assert helm_lint.is_helm_chart(str(tmp_path)) is False
 
 
+def test_is_helm_chart_false_for_unreadable_dir(mocker, tmp_path):
+    mocker.patch("os.scandir", side_effect=PermissionError)
+
+    assert helm_lint.is_helm_chart(str(tmp_path)) is False
+
+
 def test_is_helm_chart_false_for_nonexistent():
     assert helm_lint.is_helm_chart("/nonexistent") is False
 
@@ -48,17 +56,17 @@ def test_is_helm_chart_false_for_nonexistent():
 def test_validate_helm_chart_all_pass(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "Chart.yaml").write_text("name: test")
-    rendered = "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: test\n"
-    mock_run.side_effect = [
+    rendered = b"apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: test\n"
+    mock_run.side_effect = helm_calls(
         # lint
         subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
         # template
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=rendered, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=rendered, stderr=b""),
         # client dry-run
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
         # server dry-run
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-    ]
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+    )
 
     result = helm_lint.validate_helm_chart(str(tmp_path), context="my-ctx")
 
@@ -69,10 +77,48 @@ def test_validate_helm_chart_all_pass(mocker, tmp_path):
     assert result.resource_count == 1
 
 
+def test_validate_helm_chart_runs_lint_and_template_concurrently(mocker, tmp_path):
+    (tmp_path / "Chart.yaml").write_text("name: test")
+    # Each helm call blocks until the other has started; run serially this would time out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_run(cmd, **kwargs):
+        if cmd[1] in ("lint", "template"):
+            barrier.wait()
+        if kwargs.get("text"):
+            return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="ok", stderr="")
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=b"kind: ConfigMap\n", stderr=b"")
+
+    mocker.patch("subprocess.run", side_effect=fake_run)
+
+    result = helm_lint.validate_helm_chart(str(tmp_path))
+
+    assert result.lint_passed is True
+    assert result.render_passed is True
+
+
+def test_validate_helm_chart_pipes_rendered_bytes_to_kubectl(mocker, tmp_path):
+    mock_run = mocker.patch("subprocess.run")
+    (tmp_path / "Chart.yaml").write_text("name: test")
+    rendered = b"apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: test\n"
+    mock_run.side_effect = helm_calls(
+        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=rendered, stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+    )
+
+    helm_lint.validate_helm_chart(str(tmp_path))
+
+    template_call = next(c for c in mock_run.call_args_list if c.args[0][1] == "template")
+    assert "text" not in template_call.kwargs
+    assert mock_run.call_args_list[2].kwargs["input"] is rendered
+
+
 def test_validate_helm_chart_lint_fail(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "Chart.yaml").write_text("name: test")
-    mock_run.side_effect = [
+    mock_run.side_effect = helm_calls(
         subprocess.CompletedProcess(
             args=[], returncode=1, stdout="", stderr="lint error"
         ),
@@ -80,12 +126,12 @@ def test_validate_helm_chart_lint_fail(mocker, tmp_path):
         subprocess.CompletedProcess(
             args=[],
             returncode=0,
-            stdout="apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: t\n",
-            stderr="",
+            stdout=b"apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: t\n",
+            stderr=b"",
         ),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-    ]
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+    )
 
     result = helm_lint.validate_helm_chart(str(tmp_path))
 
@@ -96,12 +142,12 @@ def test_validate_helm_chart_lint_fail(mocker, tmp_path):
 def test_validate_helm_chart_render_fail_stops_early(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "Chart.yaml").write_text("name: test")
-    mock_run.side_effect = [
+    mock_run.side_effect = helm_calls(
         subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="render error"
+            args=[], returncode=1, stdout=b"", stderr=b"render error"
         ),
-    ]
+    )
 
     result = helm_lint.validate_helm_chart(str(tmp_path))
 
@@ -113,14 +159,14 @@ def test_validate_helm_chart_render_fail_stops_early(mocker, tmp_path):
 def test_validate_helm_chart_client_fail(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "Chart.yaml").write_text("name: test")
-    rendered = "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: t\n"
-    mock_run.side_effect = [
+    rendered = b"apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: t\n"
+    mock_run.side_effect = helm_calls(
         subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=rendered, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=rendered, stderr=b""),
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="client reject"
+            args=[], returncode=1, stdout=b"", stderr=b"client reject"
         ),
-    ]
+    )
 
     result = helm_lint.validate_helm_chart(str(tmp_path))
 
@@ -132,18 +178,18 @@ def test_validate_helm_chart_client_fail(mocker, tmp_path):
 def test_validate_helm_chart_server_deprecation_warnings(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "Chart.yaml").write_text("name: test")
-    rendered = "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: t\n"
-    mock_run.side_effect = [
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=rendered, stderr=""),
+    rendered = b"apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: t\n"
+    mock_run.side_effect = helm_calls(
         subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=rendered, stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
         subprocess.CompletedProcess(
             args=[],
             returncode=0,
-            stdout="",
-            stderr="Warning: apps/v1beta1 is deprecated",
+            stdout=b"",
+            stderr=b"Warning: apps/v1beta1 is deprecated",
         ),
-    ]
+    )
 
     result = helm_lint.validate_helm_chart(str(tmp_path))
 
@@ -157,13 +203,13 @@ def test_validate_helm_chart_passes_values_and_namespace(mocker, tmp_path):
     (tmp_path / "Chart.yaml").write_text("name: test")
     values = tmp_path / "values.yaml"
     values.write_text("key: val")
-    rendered = "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: t\n"
-    mock_run.side_effect = [
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=rendered, stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
+    rendered = b"apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: t\n"
+    mock_run.side_effect = helm_calls(
         subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-    ]
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=rendered, stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+    )
 
     helm_lint.validate_helm_chart(
         str(tmp_path),
@@ -173,12 +219,13 @@ def test_validate_helm_chart_passes_values_and_namespace(mocker, tmp_path):
     )
 
     # helm lint call should include -f values
-    lint_args = mock_run.call_args_list[0][0][0]
+    calls = {c.args[0][1]: c.args[0] for c in mock_run.call_args_list[:2]}
+    lint_args = calls["lint"]
     assert "-f" in lint_args
     assert str(values) in lint_args
 
     # helm template call should include namespace and release name
-    template_args = mock_run.call_args_list[1][0][0]
+    template_args = calls["template"]
     assert "--namespace" in template_args
     assert "prod" in template_args
     assert "my-release" in template_args
@@ -220,12 +267,12 @@ def test_validate_helm_chart_helm_not_found(mocker, tmp_path):
 def test_validate_helm_chart_kubectl_not_found(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "Chart.yaml").write_text("name: test")
-    rendered = "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: t\n"
-    mock_run.side_effect = [
+    rendered = b"apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: t\n"
+    mock_run.side_effect = helm_calls(
         subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=rendered, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=rendered, stderr=b""),
         FileNotFoundError("No such file or directory: 'kubectl'"),
-    ]
+    )
 
     result = helm_lint.validate_helm_chart(str(tmp_path))
 
@@ -238,12 +285,12 @@ def test_validate_helm_chart_kubectl_not_found(mocker, tmp_path):
 def test_validate_helm_chart_template_not_found(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "Chart.yaml").write_text("name: test")
-    mock_run.side_effect = [
+    mock_run.side_effect = helm_calls(
         # lint succeeds
         subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
         # template raises FileNotFoundError
         FileNotFoundError("helm"),
-    ]
+    )
 
     result = helm_lint.validate_helm_chart(str(tmp_path))
 
@@ -255,12 +302,12 @@ def test_validate_helm_chart_template_not_found(mocker, tmp_path):
 def test_validate_helm_chart_template_timeout(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "Chart.yaml").write_text("name: test")
-    mock_run.side_effect = [
+    mock_run.side_effect = helm_calls(
         # lint succeeds
         subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
         # template times out
         subprocess.TimeoutExpired(cmd="helm", timeout=60),
-    ]
+    )
 
     result = helm_lint.validate_helm_chart(str(tmp_path))
 
@@ -272,14 +319,18 @@ def test_validate_helm_chart_template_timeout(mocker, tmp_path):
 def test_validate_helm_chart_malformed_rendered_yaml(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "Chart.yaml").write_text("name: test")
-    mock_run.side_effect = [
+    mock_run.side_effect = helm_calls(
         subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="{{{bad yaml", stderr=""),
-    ]
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"{{{bad yaml", stderr=b""),
+        # kubectl client dry-run rejects the stream
+        subprocess.CompletedProcess(
+            args=[], returncode=1, stdout=b"", stderr=b"error: error parsing STDIN: yaml: line 1"
+        ),
+    )
 
     result = helm_lint.validate_helm_chart(str(tmp_path))
 
     assert result.lint_passed is True
     assert result.render_passed is True
     assert result.client_passed is False
-    assert "Failed to parse rendered YAML" in result.render_error
+    assert "error parsing STDIN" in result.client_error
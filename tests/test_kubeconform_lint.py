@@ -1,6 +1,8 @@
 import json
+import os
 import subprocess
 
+from kube_lint_mcp import kubeconform_lint
 from kube_lint_mcp.kubeconform_lint import (
     KUBECONFORM_TIMEOUT,
     _make_resource,
@@ -401,6 +403,92 @@ def test_validate_default_flags_always_present(mocker):
     assert "-verbose" in cmd
 
 
+def test_validate_passes_worker_count(mocker):
+    mocker.patch.object(kubeconform_lint, "KUBECONFORM_WORKERS", 6)
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="", stderr="",
+    )
+
+    validate_manifests("/tmp/manifests")
+
+    cmd = mock_run.call_args[0][0]
+    assert cmd[cmd.index("-n") + 1] == "6"
+
+
+def test_validate_passes_schema_cache_dir(mocker, tmp_path):
+    cache_dir = tmp_path / "schemas"
+    mocker.patch.object(kubeconform_lint, "KUBECONFORM_CACHE", str(cache_dir))
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="", stderr="",
+    )
+
+    validate_manifests("/tmp/manifests")
+
+    cmd = mock_run.call_args[0][0]
+    assert cmd[cmd.index("-cache") + 1] == str(cache_dir)
+    assert cache_dir.is_dir()
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+
+
+def test_validate_no_cache_flag_when_cache_dir_shared(mocker, tmp_path):
+    cache_dir = tmp_path / "schemas"
+    cache_dir.mkdir(mode=0o777)
+    cache_dir.chmod(0o777)
+    mocker.patch.object(kubeconform_lint, "KUBECONFORM_CACHE", str(cache_dir))
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="", stderr="",
+    )
+
+    validate_manifests("/tmp/manifests")
+
+    assert "-cache" not in mock_run.call_args[0][0]
+
+
+def test_validate_no_cache_flag_when_cache_dir_owned_by_other_user(mocker, tmp_path):
+    cache_dir = tmp_path / "schemas"
+    cache_dir.mkdir(mode=0o700)
+    mocker.patch.object(kubeconform_lint, "KUBECONFORM_CACHE", str(cache_dir))
+    mocker.patch("os.getuid", return_value=os.getuid() + 1)
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="", stderr="",
+    )
+
+    validate_manifests("/tmp/manifests")
+
+    assert "-cache" not in mock_run.call_args[0][0]
+
+
+def test_validate_no_cache_flag_when_cache_disabled(mocker):
+    mocker.patch.object(kubeconform_lint, "KUBECONFORM_CACHE", "")
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="", stderr="",
+    )
+
+    validate_manifests("/tmp/manifests")
+
+    assert "-cache" not in mock_run.call_args[0][0]
+
+
+def test_validate_no_cache_flag_when_cache_dir_unusable(mocker, tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    mocker.patch.object(kubeconform_lint, "KUBECONFORM_CACHE", str(blocker / "schemas"))
+    mock_run = mocker.patch("subprocess.run")
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="", stderr="",
+    )
+
+    result = validate_manifests("/tmp/manifests")
+
+    assert "-cache" not in mock_run.call_args[0][0]
+    assert result.passed is True
+
+
 def test_validate_path_in_command(mocker):
     mock_run = mocker.patch("subprocess.run")
     mock_run.return_value = subprocess.CompletedProcess(
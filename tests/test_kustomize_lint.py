@@ -1,6 +1,7 @@
 import subprocess
 
 from kube_lint_mcp import kustomize_lint
+from tests.helpers import kustomize_calls
 
 # constant tests
 
@@ -47,6 +48,12 @@ def test_is_kustomization_false_for_non_kustomization(tmp_path):
     assert kustomize_lint.is_kustomization(str(tmp_path)) is False
 
 
+def test_is_kustomization_false_for_unreadable_directory(mocker, tmp_path):
+    mocker.patch("os.scandir", side_effect=PermissionError("denied"))
+
+    assert kustomize_lint.is_kustomization(str(tmp_path)) is False
+
+
 def test_is_kustomization_false_for_nonexistent():
     assert kustomize_lint.is_kustomization("/nonexistent") is False
 
@@ -54,7 +61,7 @@ def test_is_kustomization_false_for_nonexistent():
 # validate_kustomization tests
 
 
-RENDERED_YAML = """\
+RENDERED_YAML = b"""\
 apiVersion: v1
 kind: Namespace
 metadata:
@@ -73,14 +80,14 @@ data:
 def test_validate_kustomization_all_pass(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "kustomization.yaml").write_text("apiVersion: kustomize.config.k8s.io/v1beta1")
-    mock_run.side_effect = [
+    mock_run.side_effect = kustomize_calls(
         # kubectl kustomize
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=RENDERED_YAML, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=RENDERED_YAML, stderr=b""),
         # client dry-run
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="configured", stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"configured", stderr=b""),
         # server dry-run
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="configured", stderr=""),
-    ]
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"configured", stderr=b""),
+    )
 
     result = kustomize_lint.validate_kustomization(str(tmp_path), context="my-ctx")
 
@@ -94,11 +101,11 @@ def test_validate_kustomization_all_pass(mocker, tmp_path):
 def test_validate_kustomization_passes_context_flag(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "kustomization.yaml").write_text("resources: []")
-    mock_run.side_effect = [
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=RENDERED_YAML, stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-    ]
+    mock_run.side_effect = kustomize_calls(
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=RENDERED_YAML, stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+    )
 
     kustomize_lint.validate_kustomization(str(tmp_path), context="prod-cluster")
 
@@ -112,11 +119,11 @@ def test_validate_kustomization_passes_context_flag(mocker, tmp_path):
 def test_validate_kustomization_no_context_flag_when_none(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "kustomization.yaml").write_text("resources: []")
-    mock_run.side_effect = [
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=RENDERED_YAML, stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-    ]
+    mock_run.side_effect = kustomize_calls(
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=RENDERED_YAML, stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+    )
 
     kustomize_lint.validate_kustomization(str(tmp_path), context=None)
 
@@ -127,11 +134,11 @@ def test_validate_kustomization_no_context_flag_when_none(mocker, tmp_path):
 def test_validate_kustomization_build_fail_stops_early(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "kustomization.yaml").write_text("resources: [missing.yaml]")
-    mock_run.side_effect = [
+    mock_run.side_effect = kustomize_calls(
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="Error: missing.yaml not found"
+            args=[], returncode=1, stdout=b"", stderr=b"Error: missing.yaml not found"
         ),
-    ]
+    )
 
     result = kustomize_lint.validate_kustomization(str(tmp_path))
 
@@ -145,12 +152,12 @@ def test_validate_kustomization_build_fail_stops_early(mocker, tmp_path):
 def test_validate_kustomization_client_fail(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "kustomization.yaml").write_text("resources: []")
-    mock_run.side_effect = [
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=RENDERED_YAML, stderr=""),
+    mock_run.side_effect = kustomize_calls(
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=RENDERED_YAML, stderr=b""),
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="error: invalid manifest"
+            args=[], returncode=1, stdout=b"", stderr=b"error: invalid manifest"
         ),
-    ]
+    )
 
     result = kustomize_lint.validate_kustomization(str(tmp_path))
 
@@ -163,13 +170,13 @@ def test_validate_kustomization_client_fail(mocker, tmp_path):
 def test_validate_kustomization_server_fail(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "kustomization.yaml").write_text("resources: []")
-    mock_run.side_effect = [
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=RENDERED_YAML, stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
+    mock_run.side_effect = kustomize_calls(
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=RENDERED_YAML, stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="error: forbidden"
+            args=[], returncode=1, stdout=b"", stderr=b"error: forbidden"
         ),
-    ]
+    )
 
     result = kustomize_lint.validate_kustomization(str(tmp_path))
 
@@ -182,16 +189,16 @@ def test_validate_kustomization_server_fail(mocker, tmp_path):
 def test_validate_kustomization_server_deprecation_warnings(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "kustomization.yaml").write_text("resources: []")
-    mock_run.side_effect = [
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=RENDERED_YAML, stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
+    mock_run.side_effect = kustomize_calls(
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=RENDERED_YAML, stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
         subprocess.CompletedProcess(
             args=[],
             returncode=0,
-            stdout="",
-            stderr="Warning: policy/v1beta1 PodSecurityPolicy is deprecated",
+            stdout=b"",
+            stderr=b"Warning: policy/v1beta1 PodSecurityPolicy is deprecated",
         ),
-    ]
+    )
 
     result = kustomize_lint.validate_kustomization(str(tmp_path))
 
@@ -204,11 +211,11 @@ def test_validate_kustomization_file_path_resolves_to_parent(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     f = tmp_path / "kustomization.yaml"
     f.write_text("resources: []")
-    mock_run.side_effect = [
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=RENDERED_YAML, stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-        subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr=""),
-    ]
+    mock_run.side_effect = kustomize_calls(
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=RENDERED_YAML, stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=b"ok", stderr=b""),
+    )
 
     kustomize_lint.validate_kustomization(str(f), context="ctx")
 
@@ -240,14 +247,18 @@ def test_validate_kustomization_kubectl_not_found(mocker, tmp_path):
 def test_validate_kustomization_malformed_yaml(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
     (tmp_path / "kustomization.yaml").write_text("resources: []")
-    mock_run.side_effect = [
+    mock_run.side_effect = kustomize_calls(
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="{{{bad yaml", stderr=""
+            args=[], returncode=0, stdout=b"{{{bad yaml", stderr=b""
         ),
-    ]
+        # kubectl client dry-run rejects the stream
+        subprocess.CompletedProcess(
+            args=[], returncode=1, stdout=b"", stderr=b"error: error parsing STDIN: yaml: line 1"
+        ),
+    )
 
     result = kustomize_lint.validate_kustomization(str(tmp_path))
 
     assert result.build_passed is True
     assert result.client_passed is False
-    assert "Failed to parse rendered YAML" in result.build_error
+    assert "error parsing STDIN" in result.client_error
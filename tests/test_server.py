@@ -1,10 +1,13 @@
+import asyncio
 import json
 import os
 import subprocess
+import threading
 
 import pytest
 
-from kube_lint_mcp import server
+from kube_lint_mcp import flux_lint, server
+from tests.helpers import helm_calls, kustomize_calls
 
 # constant tests
 
@@ -301,14 +304,13 @@ async def test_list_contexts_no_selected_shows_hint(mocker):
 @pytest.mark.asyncio
 async def test_list_contexts_shows_global_current_marker(mocker):
     mock_run = mocker.patch("subprocess.run")
-    mock_run.side_effect = [
-        subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="ctx-a\nctx-b\n", stderr=""
-        ),
-        subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="ctx-a\n", stderr=""
-        ),
-    ]
+
+    def fake_run(cmd, **kwargs):
+        # get-contexts and current-context run concurrently, so answer by command
+        stdout = "ctx-a\n" if "current-context" in cmd else "ctx-a\nctx-b\n"
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=stdout, stderr="")
+
+    mock_run.side_effect = fake_run
 
     result = await server.call_tool("list_kube_contexts", {})
 
@@ -327,10 +329,10 @@ async def test_flux_dryrun_all_pass(mocker, tmp_path):
 
     mock_run.side_effect = [
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
     ]
 
@@ -352,7 +354,10 @@ async def test_flux_dryrun_client_fail(mocker, tmp_path):
 
     mock_run.side_effect = [
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="error: invalid resource"
+            args=[], returncode=1, stdout=b"", stderr=b"error: invalid resource"
+        ),
+        subprocess.CompletedProcess(
+            args=[], returncode=1, stdout=b"", stderr=b"error: invalid resource"
         ),
     ]
 
@@ -374,10 +379,10 @@ async def test_flux_dryrun_server_fail(mocker, tmp_path):
 
     mock_run.side_effect = [
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=1, stdout=b"", stderr=b"error: forbidden"
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="error: forbidden"
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
     ]
 
@@ -399,14 +404,11 @@ async def test_flux_dryrun_server_pass_with_warnings(mocker, tmp_path):
     (tmp_path / "deploy.yaml").write_text("apiVersion: v1\nkind: ConfigMap\n")
 
     mock_run.side_effect = [
-        subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
-        ),
         subprocess.CompletedProcess(
             args=[],
             returncode=0,
-            stdout="configured\n",
-            stderr="Warning: policy/v1beta1 PodSecurityPolicy is deprecated",
+            stdout=b"configured\n",
+            stderr=b"Warning: policy/v1beta1 PodSecurityPolicy is deprecated",
         ),
     ]
 
@@ -428,20 +430,13 @@ async def test_flux_dryrun_mixed_results(mocker, tmp_path):
     (tmp_path / "a.yaml").write_text("apiVersion: v1\nkind: ConfigMap\n")
     (tmp_path / "b.yaml").write_text("apiVersion: v1\nkind: Bad\n")
 
-    mock_run.side_effect = [
-        # a.yaml client pass
-        subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
-        ),
-        # a.yaml server pass
-        subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
-        ),
-        # b.yaml client fail
-        subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="error: invalid"
-        ),
-    ]
+    def fake_run(cmd, **kwargs):
+        # The batched stdin run and b.yaml fail; a.yaml passes on its own
+        if kwargs.get("input") is not None or str(tmp_path / "b.yaml") in cmd:
+            return subprocess.CompletedProcess(args=cmd, returncode=1, stdout=b"", stderr=b"error: invalid")
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=b"configured\n", stderr=b"")
+
+    mock_run.side_effect = fake_run
 
     result = await server.call_tool("flux_dryrun", {"path": str(tmp_path)})
     text = result[0].text
@@ -450,6 +445,65 @@ async def test_flux_dryrun_mixed_results(mocker, tmp_path):
     assert "DO NOT COMMIT" in text
 
 
+@pytest.mark.asyncio
+async def test_flux_dryrun_batches_multiple_files(mocker, tmp_path):
+    mock_run = mocker.patch("subprocess.run")
+    server._contexts_listed_at = 0.0
+    server._selected_context ="test-ctx"
+    (tmp_path / "a.yaml").write_text("apiVersion: v1\nkind: ConfigMap\n")
+    (tmp_path / "b.yaml").write_text("apiVersion: v1\nkind: Secret\n")
+
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"configured\n", stderr=b""
+    )
+
+    result = await server.call_tool("flux_dryrun", {"path": str(tmp_path)})
+    text = result[0].text
+
+    assert mock_run.call_count == 1
+    assert "2 passed, 0 failed" in text
+
+
+@pytest.mark.asyncio
+async def test_flux_dryrun_per_file_when_batching_disabled(mocker, tmp_path):
+    mock_run = mocker.patch("subprocess.run")
+    mocker.patch.object(flux_lint, "BATCH_DRYRUN", False)
+    server._contexts_listed_at = 0.0
+    server._selected_context ="test-ctx"
+    (tmp_path / "a.yaml").write_text("apiVersion: v1\nkind: ConfigMap\n")
+    (tmp_path / "b.yaml").write_text("apiVersion: v1\nkind: Secret\n")
+
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"configured\n", stderr=b""
+    )
+
+    result = await server.call_tool("flux_dryrun", {"path": str(tmp_path)})
+
+    assert mock_run.call_count == 2
+    assert all(call.kwargs["input"] is None for call in mock_run.call_args_list)
+    assert "2 passed, 0 failed" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_flux_dryrun_non_strict_skips_server_for_builtin_kinds(mocker, tmp_path):
+    mock_run = mocker.patch("subprocess.run")
+    server._contexts_listed_at = 0.0
+    server._selected_context ="test-ctx"
+    (tmp_path / "a.yaml").write_text("apiVersion: v1\nkind: ConfigMap\n")
+    (tmp_path / "b.yaml").write_text("apiVersion: v1\nkind: Secret\n")
+
+    mock_run.return_value = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"configured\n", stderr=b""
+    )
+
+    result = await server.call_tool("flux_dryrun", {"path": str(tmp_path), "strict": False})
+    text = result[0].text
+
+    assert all("--dry-run=client" in call.args[0] for call in mock_run.call_args_list)
+    assert "SKIPPED (built-in kinds only)" in text
+    assert "2 passed, 0 failed" in text
+
+
 @pytest.mark.asyncio
 async def test_flux_dryrun_shows_context_and_path(mocker, tmp_path):
     mock_run = mocker.patch("subprocess.run")
@@ -459,10 +513,10 @@ async def test_flux_dryrun_shows_context_and_path(mocker, tmp_path):
 
     mock_run.side_effect = [
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
     ]
 
@@ -511,6 +565,28 @@ async def test_flux_check_unhealthy(mocker):
     assert "Context: test-ctx" in text
 
 
+@pytest.mark.asyncio
+async def test_flux_check_and_status_run_concurrently(mocker):
+    server._contexts_listed_at = 0.0
+    server._selected_context ="test-ctx"
+    # Each fake flux call only returns once the other one has started
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_run(cmd, **kwargs):
+        barrier.wait()
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="ok\n", stderr="")
+
+    mocker.patch("subprocess.run", side_effect=fake_run)
+
+    check, status = await asyncio.gather(
+        server.call_tool("flux_check", {}),
+        server.call_tool("flux_status", {}),
+    )
+
+    assert "HEALTHY" in check[0].text
+    assert "Flux Status:" in status[0].text
+
+
 # flux_status integration tests
 
 
@@ -555,7 +631,7 @@ async def test_flux_status_failure(mocker):
 # kustomize_dryrun integration tests
 
 
-KUSTOMIZE_RENDERED_YAML = """\
+KUSTOMIZE_RENDERED_YAML = b"""\
 apiVersion: v1
 kind: Namespace
 metadata:
@@ -578,20 +654,20 @@ async def test_kustomize_dryrun_all_pass(mocker, tmp_path):
     server._selected_context ="test-ctx"
     (tmp_path / "kustomization.yaml").write_text("apiVersion: kustomize.config.k8s.io/v1beta1")
 
-    mock_run.side_effect = [
+    mock_run.side_effect = kustomize_calls(
         # kubectl kustomize
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=KUSTOMIZE_RENDERED_YAML, stderr=""
+            args=[], returncode=0, stdout=KUSTOMIZE_RENDERED_YAML, stderr=b""
         ),
         # kubectl client dry-run
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         # kubectl server dry-run
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
-    ]
+    )
 
     result = await server.call_tool("kustomize_dryrun", {"path": str(tmp_path)})
     text = result[0].text
@@ -609,11 +685,11 @@ async def test_kustomize_dryrun_build_fail(mocker, tmp_path):
     server._selected_context ="test-ctx"
     (tmp_path / "kustomization.yaml").write_text("resources: [missing.yaml]")
 
-    mock_run.side_effect = [
+    mock_run.side_effect = kustomize_calls(
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="Error: missing.yaml not found"
+            args=[], returncode=1, stdout=b"", stderr=b"Error: missing.yaml not found"
         ),
-    ]
+    )
 
     result = await server.call_tool("kustomize_dryrun", {"path": str(tmp_path)})
     text = result[0].text
@@ -630,14 +706,14 @@ async def test_kustomize_dryrun_client_fail(mocker, tmp_path):
     server._selected_context ="test-ctx"
     (tmp_path / "kustomization.yaml").write_text("resources: []")
 
-    mock_run.side_effect = [
+    mock_run.side_effect = kustomize_calls(
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=KUSTOMIZE_RENDERED_YAML, stderr=""
+            args=[], returncode=0, stdout=KUSTOMIZE_RENDERED_YAML, stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="error: invalid manifest"
+            args=[], returncode=1, stdout=b"", stderr=b"error: invalid manifest"
         ),
-    ]
+    )
 
     result = await server.call_tool("kustomize_dryrun", {"path": str(tmp_path)})
     text = result[0].text
@@ -655,17 +731,17 @@ async def test_kustomize_dryrun_server_fail(mocker, tmp_path):
     server._selected_context ="test-ctx"
     (tmp_path / "kustomization.yaml").write_text("resources: []")
 
-    mock_run.side_effect = [
+    mock_run.side_effect = kustomize_calls(
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=KUSTOMIZE_RENDERED_YAML, stderr=""
+            args=[], returncode=0, stdout=KUSTOMIZE_RENDERED_YAML, stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="error: forbidden"
+            args=[], returncode=1, stdout=b"", stderr=b"error: forbidden"
         ),
-    ]
+    )
 
     result = await server.call_tool("kustomize_dryrun", {"path": str(tmp_path)})
     text = result[0].text
@@ -682,20 +758,20 @@ async def test_kustomize_dryrun_server_pass_with_warnings(mocker, tmp_path):
     server._selected_context ="test-ctx"
     (tmp_path / "kustomization.yaml").write_text("resources: []")
 
-    mock_run.side_effect = [
+    mock_run.side_effect = kustomize_calls(
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=KUSTOMIZE_RENDERED_YAML, stderr=""
+            args=[], returncode=0, stdout=KUSTOMIZE_RENDERED_YAML, stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         subprocess.CompletedProcess(
             args=[],
             returncode=0,
-            stdout="configured\n",
-            stderr="Warning: policy/v1beta1 PodSecurityPolicy is deprecated",
+            stdout=b"configured\n",
+            stderr=b"Warning: policy/v1beta1 PodSecurityPolicy is deprecated",
         ),
-    ]
+    )
 
     result = await server.call_tool("kustomize_dryrun", {"path": str(tmp_path)})
     text = result[0].text
@@ -713,17 +789,17 @@ async def test_kustomize_dryrun_shows_context_and_path(mocker, tmp_path):
     server._selected_context ="prod-cluster"
     (tmp_path / "kustomization.yaml").write_text("resources: []")
 
-    mock_run.side_effect = [
+    mock_run.side_effect = kustomize_calls(
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=KUSTOMIZE_RENDERED_YAML, stderr=""
+            args=[], returncode=0, stdout=KUSTOMIZE_RENDERED_YAML, stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
-    ]
+    )
 
     result = await server.call_tool("kustomize_dryrun", {"path": str(tmp_path)})
     text = result[0].text
@@ -735,7 +811,7 @@ async def test_kustomize_dryrun_shows_context_and_path(mocker, tmp_path):
 # helm_dryrun integration tests
 
 
-HELM_RENDERED_YAML = """\
+HELM_RENDERED_YAML = b"""\
 apiVersion: v1
 kind: ConfigMap
 metadata:
@@ -760,24 +836,24 @@ async def test_helm_dryrun_all_pass(mocker, tmp_path):
     server._selected_context ="test-ctx"
     (tmp_path / "Chart.yaml").write_text("name: test-chart\nversion: 0.1.0\n")
 
-    mock_run.side_effect = [
+    mock_run.side_effect = helm_calls(
         # helm lint
         subprocess.CompletedProcess(
             args=[], returncode=0, stdout="1 chart(s) linted\n", stderr=""
         ),
         # helm template
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=HELM_RENDERED_YAML, stderr=""
+            args=[], returncode=0, stdout=HELM_RENDERED_YAML, stderr=b""
         ),
         # kubectl client dry-run
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         # kubectl server dry-run
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
-    ]
+    )
 
     result = await server.call_tool("helm_dryrun", {"chart_path": str(tmp_path)})
     text = result[0].text
@@ -796,24 +872,24 @@ async def test_helm_dryrun_lint_fail(mocker, tmp_path):
     server._selected_context ="test-ctx"
     (tmp_path / "Chart.yaml").write_text("name: test-chart\nversion: 0.1.0\n")
 
-    mock_run.side_effect = [
+    mock_run.side_effect = helm_calls(
         # helm lint fails
         subprocess.CompletedProcess(
             args=[], returncode=1, stdout="", stderr="[ERROR] templates/: parse error"
         ),
         # helm template still runs
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=HELM_RENDERED_YAML, stderr=""
+            args=[], returncode=0, stdout=HELM_RENDERED_YAML, stderr=b""
         ),
         # kubectl client dry-run
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         # kubectl server dry-run
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
-    ]
+    )
 
     result = await server.call_tool("helm_dryrun", {"chart_path": str(tmp_path)})
     text = result[0].text
@@ -830,16 +906,16 @@ async def test_helm_dryrun_render_fail(mocker, tmp_path):
     server._selected_context ="test-ctx"
     (tmp_path / "Chart.yaml").write_text("name: test-chart\nversion: 0.1.0\n")
 
-    mock_run.side_effect = [
+    mock_run.side_effect = helm_calls(
         # helm lint passes
         subprocess.CompletedProcess(
             args=[], returncode=0, stdout="ok\n", stderr=""
         ),
         # helm template fails
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="Error: template rendering failed"
+            args=[], returncode=1, stdout=b"", stderr=b"Error: template rendering failed"
         ),
-    ]
+    )
 
     result = await server.call_tool("helm_dryrun", {"chart_path": str(tmp_path)})
     text = result[0].text
@@ -857,20 +933,20 @@ async def test_helm_dryrun_client_fail(mocker, tmp_path):
     server._selected_context ="test-ctx"
     (tmp_path / "Chart.yaml").write_text("name: test-chart\nversion: 0.1.0\n")
 
-    mock_run.side_effect = [
+    mock_run.side_effect = helm_calls(
         # helm lint
         subprocess.CompletedProcess(
             args=[], returncode=0, stdout="ok\n", stderr=""
         ),
         # helm template
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=HELM_RENDERED_YAML, stderr=""
+            args=[], returncode=0, stdout=HELM_RENDERED_YAML, stderr=b""
         ),
         # kubectl client dry-run fails
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="error: invalid manifest"
+            args=[], returncode=1, stdout=b"", stderr=b"error: invalid manifest"
         ),
-    ]
+    )
 
     result = await server.call_tool("helm_dryrun", {"chart_path": str(tmp_path)})
     text = result[0].text
@@ -887,24 +963,24 @@ async def test_helm_dryrun_server_fail(mocker, tmp_path):
     server._selected_context ="test-ctx"
     (tmp_path / "Chart.yaml").write_text("name: test-chart\nversion: 0.1.0\n")
 
-    mock_run.side_effect = [
+    mock_run.side_effect = helm_calls(
         # helm lint
         subprocess.CompletedProcess(
             args=[], returncode=0, stdout="ok\n", stderr=""
         ),
         # helm template
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=HELM_RENDERED_YAML, stderr=""
+            args=[], returncode=0, stdout=HELM_RENDERED_YAML, stderr=b""
         ),
         # kubectl client dry-run passes
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         # kubectl server dry-run fails
         subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="error: forbidden"
+            args=[], returncode=1, stdout=b"", stderr=b"error: forbidden"
         ),
-    ]
+    )
 
     result = await server.call_tool("helm_dryrun", {"chart_path": str(tmp_path)})
     text = result[0].text
@@ -921,27 +997,27 @@ async def test_helm_dryrun_server_pass_with_warnings(mocker, tmp_path):
     server._selected_context ="test-ctx"
     (tmp_path / "Chart.yaml").write_text("name: test-chart\nversion: 0.1.0\n")
 
-    mock_run.side_effect = [
+    mock_run.side_effect = helm_calls(
         # helm lint
         subprocess.CompletedProcess(
             args=[], returncode=0, stdout="ok\n", stderr=""
         ),
         # helm template
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=HELM_RENDERED_YAML, stderr=""
+            args=[], returncode=0, stdout=HELM_RENDERED_YAML, stderr=b""
         ),
         # kubectl client dry-run
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         # kubectl server dry-run with deprecation
         subprocess.CompletedProcess(
             args=[],
             returncode=0,
-            stdout="configured\n",
-            stderr="Warning: batch/v1beta1 CronJob is deprecated",
+            stdout=b"configured\n",
+            stderr=b"Warning: batch/v1beta1 CronJob is deprecated",
         ),
-    ]
+    )
 
     result = await server.call_tool("helm_dryrun", {"chart_path": str(tmp_path)})
     text = result[0].text
@@ -960,20 +1036,20 @@ async def test_helm_dryrun_shows_values_and_namespace(mocker, tmp_path):
     (tmp_path / "Chart.yaml").write_text("name: test-chart\nversion: 0.1.0\n")
     values_file = str(tmp_path / "values-prod.yaml")
 
-    mock_run.side_effect = [
+    mock_run.side_effect = helm_calls(
         subprocess.CompletedProcess(
             args=[], returncode=0, stdout="ok\n", stderr=""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=HELM_RENDERED_YAML, stderr=""
+            args=[], returncode=0, stdout=HELM_RENDERED_YAML, stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
         subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="configured\n", stderr=""
+            args=[], returncode=0, stdout=b"configured\n", stderr=b""
         ),
-    ]
+    )
 
     result = await server.call_tool(
         "helm_dryrun",
@@ -1004,6 +1080,14 @@ def test_normalize_path_resolves_relative():
     assert "/." not in result
 
 
+def test_normalize_path_resolves_symlinks(tmp_path):
+    target = tmp_path / "charts"
+    target.mkdir()
+    (tmp_path / "link").symlink_to(target)
+
+    assert server._normalize_path(str(tmp_path / "link")) == os.path.realpath(target)
+
+
 # kubeconform_validate integration tests
 
 
@@ -1373,13 +1457,13 @@ ARGOCD_LIST_JSON = json.dumps({
             },
         },
     ],
-})
+}).encode()
 
 KUBECTL_EMPTY_LIST_JSON = json.dumps({
     "apiVersion": "argoproj.io/v1alpha1",
     "kind": "ApplicationList",
     "items": [],
-})
+}).encode()
 
 ARGOCD_GET_JSON = json.dumps({
     "metadata": {"name": "my-app", "namespace": "argocd"},
@@ -1407,7 +1491,7 @@ ARGOCD_GET_JSON = json.dumps({
             },
         ],
     },
-})
+}).encode()
 
 ARGOCD_GET_MINIMAL_JSON = json.dumps({
     "metadata": {"name": "my-app", "namespace": "argocd"},
@@ -1423,7 +1507,7 @@ ARGOCD_GET_MINIMAL_JSON = json.dumps({
         "sync": {"status": "OutOfSync", "revision": "def456"},
         "health": {"status": "Degraded", "message": "container failing"},
     },
-})
+}).encode()
 
 
 @pytest.mark.asyncio
@@ -1441,7 +1525,7 @@ async def test_argocd_app_list_success(mocker):
 
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=ARGOCD_LIST_JSON, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=ARGOCD_LIST_JSON, stderr=b""),
     ]
 
     result = await server.call_tool("argocd_app_list", {})
@@ -1463,7 +1547,7 @@ async def test_argocd_app_list_empty(mocker):
 
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_EMPTY_LIST_JSON, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_EMPTY_LIST_JSON, stderr=b""),
     ]
 
     result = await server.call_tool("argocd_app_list", {})
@@ -1480,7 +1564,7 @@ async def test_argocd_app_list_with_namespace(mocker):
     server._selected_context ="test-ctx"
 
     mock_run.return_value = subprocess.CompletedProcess(
-        args=[], returncode=0, stdout=ARGOCD_LIST_JSON, stderr=""
+        args=[], returncode=0, stdout=ARGOCD_LIST_JSON, stderr=b""
     )
 
     result = await server.call_tool("argocd_app_list", {"namespace": "argo-cd"})
@@ -1497,7 +1581,7 @@ async def test_argocd_app_list_error(mocker):
 
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="connection refused"),
+        subprocess.CompletedProcess(args=[], returncode=1, stdout=b"", stderr=b"connection refused"),
     ]
 
     result = await server.call_tool("argocd_app_list", {})
@@ -1515,7 +1599,7 @@ async def test_argocd_app_list_shows_context(mocker):
 
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_EMPTY_LIST_JSON, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=KUBECTL_EMPTY_LIST_JSON, stderr=b""),
     ]
 
     result = await server.call_tool("argocd_app_list", {})
@@ -1554,7 +1638,7 @@ async def test_argocd_app_get_success(mocker):
 
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=ARGOCD_GET_JSON, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=ARGOCD_GET_JSON, stderr=b""),
     ]
 
     result = await server.call_tool("argocd_app_get", {"app_name": "my-app"})
@@ -1576,7 +1660,7 @@ async def test_argocd_app_get_with_resources_and_conditions(mocker):
 
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=ARGOCD_GET_JSON, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=ARGOCD_GET_JSON, stderr=b""),
     ]
 
     result = await server.call_tool("argocd_app_get", {"app_name": "my-app"})
@@ -1596,7 +1680,7 @@ async def test_argocd_app_get_with_health_message(mocker):
 
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=ARGOCD_GET_MINIMAL_JSON, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=ARGOCD_GET_MINIMAL_JSON, stderr=b""),
     ]
 
     result = await server.call_tool("argocd_app_get", {"app_name": "my-app"})
@@ -1614,7 +1698,7 @@ async def test_argocd_app_get_error(mocker):
 
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="app 'missing' not found"),
+        subprocess.CompletedProcess(args=[], returncode=1, stdout=b"", stderr=b"app 'missing' not found"),
     ]
 
     result = await server.call_tool("argocd_app_get", {"app_name": "missing"})
@@ -1632,7 +1716,7 @@ async def test_argocd_app_get_shows_context_and_app(mocker):
 
     mock_run.side_effect = [
         _DETECT_OK,
-        subprocess.CompletedProcess(args=[], returncode=0, stdout=ARGOCD_GET_JSON, stderr=""),
+        subprocess.CompletedProcess(args=[], returncode=0, stdout=ARGOCD_GET_JSON, stderr=b""),
     ]
 
     result = await server.call_tool(
@@ -105,6 +105,14 @@ def test_find_yaml_files_sorted(tmp_path):
     assert names == ["a.yaml", "b.yaml", "c.yaml"]
 
 
+def test_find_yaml_files_skips_directories_and_non_recursive(tmp_path):
+    (tmp_path / "charts.yaml").mkdir()
+    (tmp_path / "charts.yaml" / "nested.yaml").write_text("a: 1")
+    (tmp_path / "top.yaml").write_text("b: 2")
+
+    assert _find_yaml_files(str(tmp_path)) == [str(tmp_path / "top.yaml")]
+
+
 # validate_file tests
 
 